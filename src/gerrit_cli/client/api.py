@@ -1,13 +1,44 @@
 """Gerrit REST API Client"""
 
 import json
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 
 import httpx
-
-from gerrit_cli.client.models import Change, ChangeDetail, CommentInfo, ReviewInput, ReviewResult
+from pydantic import TypeAdapter, ValidationError
+
+from gerrit_cli.client.models import (
+    SPECIAL_FILES,
+    Change,
+    ChangeDetail,
+    CommentInfo,
+    ReviewInput,
+    ReviewResult,
+)
 from gerrit_cli.utils.exceptions import ApiError, AuthenticationError, NotFoundError
 
+_json_loads: Callable[[bytes], Any]
+try:
+    # Optional fast JSON parser (pip install gerrit-agent[fast])
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+T = TypeVar("T")
+
+# Prefix Gerrit puts in front of every JSON response to prevent XSSI
+_XSSI_PREFIX = b")]}'\n"
+
+# Validators for container responses, built once instead of looping model_validate per item
+_CHANGE_LIST_ADAPTER = TypeAdapter(list[Change])
+_COMMENTS_ADAPTER = TypeAdapter(dict[str, list[CommentInfo]])
+
+
+def _option_params(options: Optional[list[str]]) -> list[tuple[str, Any]]:
+    """Build repeated "o" query params for the given return options"""
+    return [("o", opt) for opt in options] if options else []
+
 
 class GerritClient:
     """Gerrit REST API Client"""
@@ -57,6 +88,27 @@ class GerritClient:
         Returns:
             Parsed JSON response
 
+        Raises:
+            AuthenticationError: Authentication failed
+            NotFoundError: Resource not found
+            ApiError: Other API errors
+        """
+        return self._parse_response(self._request(method, endpoint, params=params, data=data))
+
+    def _request(
+        self, method: str, endpoint: str, params: Optional[Union[dict[str, Any], list[tuple[str, Any]]]] = None, data: Any = None
+    ) -> httpx.Response:
+        """Send request and check the response status
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (will auto prepend /a/)
+            params: URL query params
+            data: Request body data
+
+        Returns:
+            HTTP response object (status < 400)
+
         Raises:
             AuthenticationError: Authentication failed
             NotFoundError: Resource not found
@@ -87,8 +139,7 @@ class GerritClient:
                     status_code=response.status_code,
                 )
 
-            # Parse response
-            return self._parse_response(response)
+            return response
 
         except httpx.RequestError as e:
             raise ApiError(f"Network request failed: {e}")
@@ -104,21 +155,69 @@ class GerritClient:
         Returns:
             Parsed JSON data (dict or list)
         """
-        text = response.text
-
-        # Remove Gerrit security prefix
-        if text.startswith(")]}'\n"):
-            text = text[5:]
+        body = self._strip_xssi(response).strip()
 
         # Empty response
-        if not text.strip():
+        if not body:
+            return {}
+
+        # Empty containers are the most common result of a query, skip the parser
+        if body == b"[]":
+            return []
+        if body == b"{}":
             return {}
 
         try:
-            return json.loads(text)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return _json_loads(body)
         except json.JSONDecodeError as e:
             raise ApiError(f"JSON parse failed: {e}")
 
+    @staticmethod
+    def _strip_xssi(response: httpx.Response) -> bytes:
+        """Return the raw response body without Gerrit's )]}' security prefix
+
+        Works on the bytes, JSON parsers and validators accept UTF-8 bytes directly.
+        """
+        body = response.content
+        if body[:5] == _XSSI_PREFIX:
+            body = body[5:]
+        return body
+
+    def _validate_response(
+        self,
+        response: httpx.Response,
+        validate_json: Callable[[bytes], T],
+        empty: Optional[tuple[bytes, Callable[[], T]]] = None,
+    ) -> T:
+        """Parse and validate a JSON response in one pass (no intermediate dict/list)
+
+        Args:
+            response: HTTP response object
+            validate_json: Pydantic validate_json of the expected type
+            empty: (empty JSON container body, factory of the empty value). An empty
+                body or that exact body returns the factory's value without running
+                the validator
+
+        Returns:
+            Validated model(s)
+
+        Raises:
+            ApiError: Response is not valid JSON
+        """
+        body = self._strip_xssi(response).strip()
+        if empty is not None and (not body or body == empty[0]):
+            return empty[1]()
+        if not body:
+            body = b"{}"
+
+        try:
+            return validate_json(body)
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise ApiError(f"JSON parse failed: {e}")
+            raise
+
     # ==================== Changes API ====================
 
     def list_changes(
@@ -134,17 +233,13 @@ class GerritClient:
         Returns:
             List of Change objects
         """
-        params: list[tuple[str, Any]] = [("q", query), ("n", str(limit))]
-
-        # Add return options
-        if options:
-            for opt in options:
-                params.append(("o", opt))
+        # Query, limit and return options in one list (o may repeat)
+        params: list[tuple[str, Any]] = [("q", query), ("n", str(limit)), *_option_params(options)]
 
-        data = self._make_request("GET", "/changes/", params=params)
+        response = self._request("GET", "/changes/", params=params)
 
         # Parse as Change object list
-        return [Change.model_validate(item) for item in data]
+        return self._validate_response(response, _CHANGE_LIST_ADAPTER.validate_json, (b"[]", list))
 
     def get_change(self, change_id: str, options: Optional[list[str]] = None) -> ChangeDetail:
         """Get details of a single change
@@ -156,13 +251,10 @@ class GerritClient:
         Returns:
             ChangeDetail object
         """
-        params: list[tuple[str, Any]] = []
-        if options:
-            for opt in options:
-                params.append(("o", opt))
+        params = _option_params(options)
 
-        data = self._make_request("GET", f"/changes/{change_id}", params=params)
-        return ChangeDetail.model_validate(data)
+        response = self._request("GET", f"/changes/{change_id}", params=params)
+        return self._validate_response(response, ChangeDetail.model_validate_json)
 
     def get_change_comments(self, change_id: str) -> dict[str, list[CommentInfo]]:
         """Get all comments for a change
@@ -173,27 +265,26 @@ class GerritClient:
         Returns:
             Map of file path to comment list
         """
-        data = self._make_request("GET", f"/changes/{change_id}/comments")
+        response = self._request("GET", f"/changes/{change_id}/comments")
 
         # Parse comments
-        result: dict[str, list[CommentInfo]] = {}
-        for file_path, comments in data.items():
-            result[file_path] = [CommentInfo.model_validate(c) for c in comments]
+        return self._validate_response(response, _COMMENTS_ADAPTER.validate_json, (b"{}", dict))
 
-        return result
-
-    def get_change_detail(self, change_id: str) -> ChangeDetail:
+    def get_change_detail(self, change_id: str, include_messages: bool = True) -> ChangeDetail:
         """Get change details (including messages and labels)
 
         Args:
             change_id: Change ID
+            include_messages: Whether to fetch the message history. Messages are usually
+                the bulk of the response, leaving them out keeps it small when unused.
 
         Returns:
             ChangeDetail object
         """
-        return self.get_change(
-            change_id, options=["CURRENT_REVISION", "MESSAGES", "DETAILED_LABELS", "DETAILED_ACCOUNTS"]
-        )
+        options = ["CURRENT_REVISION", "DETAILED_LABELS", "DETAILED_ACCOUNTS"]
+        if include_messages:
+            options.insert(1, "MESSAGES")
+        return self.get_change(change_id, options=options)
 
     # ==================== Review API ====================
 
@@ -296,7 +387,7 @@ class GerritClient:
 
         for file_path in files.keys():
             # Skip commit message and other special files
-            if file_path in ["/COMMIT_MSG", "/MERGE_LIST"]:
+            if file_path in SPECIAL_FILES:
                 continue
 
             try:
@@ -4,11 +4,14 @@ from typing import Any, List, Optional, Union, Dict
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Entries of a revision's file list that are not real files and have no diff of their own
+SPECIAL_FILES = frozenset({"/COMMIT_MSG", "/MERGE_LIST"})
+
 
 class Account(BaseModel):
     """Gerrit Account Info"""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     account_id: int = Field(alias="_account_id")
     name: Optional[str] = None
@@ -19,7 +22,7 @@ class Account(BaseModel):
 class Change(BaseModel):
     """Change Basic Info"""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     id: str
     project: str
@@ -45,6 +48,8 @@ class Change(BaseModel):
 class LabelInfo(BaseModel):
     """Label Info"""
 
+    model_config = ConfigDict(frozen=True)
+
     approved: Optional[Account] = None
     rejected: Optional[Account] = None
     recommended: Optional[Account] = None
@@ -58,6 +63,8 @@ class LabelInfo(BaseModel):
 class MessageInfo(BaseModel):
     """Message Info"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     author: Optional[Account] = None
     date: str
@@ -68,6 +75,8 @@ class MessageInfo(BaseModel):
 class FileInfo(BaseModel):
     """File Info"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: Optional[str] = None
     binary: Optional[bool] = None
     old_path: Optional[str] = None
@@ -90,6 +99,8 @@ class ChangeDetail(Change):
 class CommentInfo(BaseModel):
     """Comment Info"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: Optional[str] = None
     patch_set: Optional[int] = None
     path: Optional[str] = None
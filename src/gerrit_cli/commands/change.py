@@ -1,25 +1,20 @@
 """Change Command Group"""
 
 import sys
-from typing import Optional
+from typing import Any, Optional
 
 import rich_click as click
 
-from gerrit_cli.client.api import GerritClient
-from gerrit_cli.formatters import get_formatter
 from gerrit_cli.utils.exceptions import GerritCliError
 from gerrit_cli.utils.helpers import (
     branch_exists,
-    check_git_repository,
-    check_remote_exists,
     check_working_directory_clean,
     checkout_branch,
     checkout_fetch_head,
     delete_branch,
     fetch_change_ref,
+    gather_repo_state,
     get_current_branch,
-    get_git_remote_url,
-    get_repo_root,
     stash_changes,
 )
 
@@ -59,6 +54,9 @@ def list(
         gerrit list --owner me
         gerrit list --project myproject --format json
     """
+    from gerrit_cli.client.api import GerritClient
+    from gerrit_cli.formatters import get_formatter
+
     config = ctx.obj["config"]
 
     try:
@@ -145,6 +143,10 @@ def view(
     gerrit view 12345 -p m,f,c       # Only view metadata, files and comments
     gerrit view 12345 -p d --context 10 # Only view diff with 10 lines of context
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from gerrit_cli.client.api import GerritClient
+    from gerrit_cli.formatters import get_formatter
     from gerrit_cli.utils.show_parts import get_parts_to_show
 
     config = ctx.obj["config"]
@@ -153,18 +155,31 @@ def view(
         # 解析要显示的部分
         show_parts = get_parts_to_show(parts)
 
-        with GerritClient(config.url, config.username, config.password) as client:
+        with (
+            GerritClient(config.url, config.username, config.password) as client,
+            ThreadPoolExecutor(max_workers=3) as pool,
+        ):
+            # 基本信息、文件列表、评论互不依赖，并发请求
             # 1. 获取基本信息（总是需要）
-            change = client.get_change_detail(change_id)
+            change_future = pool.submit(
+                client.get_change_detail, change_id, include_messages=show_parts["messages"]
+            )
 
             # 2. 根据需要获取额外数据
-            files_data = None
+            files_future = None
+            comments_future = None
             diffs_data = None
-            comments_data = None
 
             # 获取文件列表（如果需要显示文件或 diff）
             if show_parts["files"] or show_parts["diff"]:
-                files_data = client.get_change_files(change_id)
+                files_future = pool.submit(client.get_change_files, change_id)
+
+            # 获取评论（如果需要）
+            if show_parts["comments"]:
+                comments_future = pool.submit(client.get_change_comments, change_id)
+
+            change = change_future.result()
+            files_data = files_future.result() if files_future else None
 
             # 获取 diff（如果需要）
             if show_parts["diff"]:
@@ -183,31 +198,22 @@ def view(
                 else:
                     diffs_data = client.get_all_diffs(change_id, context=context)
 
-            # 获取评论（如果需要）
-            if show_parts["comments"]:
-                comments_data = client.get_change_comments(change_id)
+            comments_data = comments_future.result() if comments_future else None
 
             # 3. 格式化输出
             if output_format == "json":
-                import json
+                from gerrit_cli.formatters.json import to_json
 
-                output_data = {
-                    "change": change.model_dump()
-                    if hasattr(change, "model_dump")
-                    else change.__dict__,
-                }
+                # Models are serialized in place, no model_dump() round trip
+                output_data: dict[str, Any] = {"change": change}
                 if files_data:
                     output_data["files"] = files_data
                 if diffs_data:
                     output_data["diffs"] = diffs_data
                 if comments_data:
-                    # Convert CommentInfo Pydantic models to dicts for JSON serialization
-                    output_data["comments"] = {
-                        file_path: [comment.model_dump() for comment in comments]
-                        for file_path, comments in comments_data.items()
-                    }
+                    output_data["comments"] = comments_data
 
-                click.echo(json.dumps(output_data, indent=2, ensure_ascii=False))
+                click.echo(to_json(output_data))
             else:
                 # Table 格式 - 使用完整视图
                 formatter = get_formatter(output_format)
@@ -250,6 +256,8 @@ def comment(
         gerrit change comment 12345 -m "LGTM"
         gerrit change comment 12345 -f comment.txt
     """
+    from gerrit_cli.client.api import GerritClient
+
     config = ctx.obj["config"]
 
     try:
@@ -323,11 +331,15 @@ def checkout(
         # Auto stash uncommitted changes
         gerrit checkout 12345 --stash
     """
+    from gerrit_cli.client.api import GerritClient
+
     config = ctx.obj["config"]
 
     try:
         # 1. Check if inside a Git repository
-        if not check_git_repository():
+        # Probe repo root, branch and remote together instead of one git call at a time
+        repo_state = gather_repo_state("origin")
+        if not repo_state["is_repo"]:
             click.echo("Error: Current directory is not a Git repository", err=True)
             click.echo()
             click.echo("Please cd into the Gerrit project's Git repository before running this command.", err=True)
@@ -343,12 +355,13 @@ def checkout(
             change = client.get_change(change_id, options=["CURRENT_REVISION", "DOWNLOAD_COMMANDS", "DETAILED_ACCOUNTS"])
 
         # 3. Verify current repo matches project
-        repo_root = get_repo_root()
+        repo_root = repo_state["root"]
         if repo_root:
             click.echo(f"Current repo: {repo_root}")
 
-        # Check if remote exists
-        if not check_remote_exists("origin"):
+        # Check if remote exists (get-url fails for a missing remote)
+        remote_url = repo_state["remote_url"]
+        if remote_url is None:
             click.echo()
             click.echo("Warning: 'origin' remote not found in current Git repository", err=True)
             click.echo("Fetch operation may fail.", err=True)
@@ -358,8 +371,7 @@ def checkout(
                 click.echo("Operation cancelled")
                 sys.exit(0)
         else:
-            # Get remote URL and warn user
-            remote_url = get_git_remote_url("origin")
+            # Warn user if remote URL does not match
             if remote_url:
                 click.echo(f"Remote URL: {remote_url}")
 
@@ -415,7 +427,7 @@ def checkout(
         if branch_exists(branch_name):
             if force:
                 click.echo(f"Warning: Branch '{branch_name}' exists, deleting...")
-                current = get_current_branch()
+                current = repo_state["branch"]
                 if current == branch_name:
                     click.echo("Error: Cannot delete current branch, please switch to another branch first", err=True)
                     sys.exit(1)
@@ -2,14 +2,18 @@
 
 import re
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import rich_click as click
 
-from gerrit_cli.client.api import GerritClient
-from gerrit_cli.client.models import CommentInput, CommentRange, ReviewInput
 from gerrit_cli.utils.exceptions import GerritCliError
 
+if TYPE_CHECKING:
+    from gerrit_cli.client.models import CommentInput
+
+# Character range location in --inline-comment: L12C13-L12C19
+_CHAR_RANGE_RE = re.compile(r"^L(\d+)C(\d+)-L(\d+)C(\d+)$", re.IGNORECASE)
+
 
 @click.command()
 @click.argument("change_id")
@@ -57,6 +61,9 @@ def review(
         gerrit review 12345 --inline-comment src/main.py#10-20 "Refactor this block"
         gerrit review 12345 --inline-comment src/main.py#L12C13-L12C19 "Specific syntax error"
     """
+    from gerrit_cli.client.api import GerritClient
+    from gerrit_cli.client.models import ReviewInput
+
     config = ctx.obj["config"]
 
     try:
@@ -84,56 +91,11 @@ def review(
             sys.exit(1)
 
         # Build ReviewInput
-        comments: dict[str, list[CommentInput]] = {}
-        for location_spec, m in inline_comment:
-            if "#" not in location_spec:
-                click.echo(f"Error: Invalid inline comment format '{location_spec}'. Expected 'file#location'", err=True)
-                sys.exit(1)
-
-            f, l_raw = location_spec.rsplit("#", 1)
-
-            if f not in comments:
-                comments[f] = []
-
-            # Parse line or range
-            line: int
-            comment_range: Optional[CommentRange] = None
-
-            # Check for character range: L12C13-L12C19 (case insensitive)
-            char_range_match = re.match(r"^L(\d+)C(\d+)-L(\d+)C(\d+)$", l_raw, re.IGNORECASE)
-            if char_range_match:
-                start_line, start_char, end_line, end_char = map(int, char_range_match.groups())
-                line = end_line
-                comment_range = CommentRange(
-                    start_line=start_line,
-                    start_character=start_char,
-                    end_line=end_line,
-                    end_character=end_char,
-                )
-            elif "-" in l_raw:
-                try:
-                    start, end = map(int, l_raw.split("-"))
-                    line = end
-                    comment_range = CommentRange(
-                        start_line=start,
-                        start_character=0,
-                        end_line=end,
-                        end_character=10000,
-                    )
-                except ValueError:
-                    click.echo(
-                        f"Error: Invalid line format '{l_raw}', expected 'line', 'start-end', or 'LnCm-LnCm'",
-                        err=True,
-                    )
-                    sys.exit(1)
-            else:
-                try:
-                    line = int(l_raw)
-                except ValueError:
-                    click.echo(f"Error: Invalid line number '{l_raw}'", err=True)
-                    sys.exit(1)
-
-            comments[f].append(CommentInput(line=line, message=m, range=comment_range))
+        try:
+            comments = _parse_inline_comments(inline_comment)
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
 
         review_input = ReviewInput(
             message=review_message,
@@ -165,3 +127,69 @@ def review(
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+
+
+def _parse_inline_comments(specs: list[tuple[str, str]]) -> "dict[str, list[CommentInput]]":
+    """Parse --inline-comment values into CommentInput lists keyed by file path
+
+    Args:
+        specs: (file#location, message) pairs. location is a line ("10"), a line
+            range ("10-20") or a character range ("L12C13-L12C19")
+
+    Returns:
+        Map of file path to its comments
+
+    Raises:
+        ValueError: Malformed location spec
+    """
+    from gerrit_cli.client.models import CommentInput, CommentRange
+
+    comments: dict[str, list[CommentInput]] = {}
+    for location_spec, m in specs:
+        if "#" not in location_spec:
+            raise ValueError(
+                f"Invalid inline comment format '{location_spec}'. Expected 'file#location'"
+            )
+
+        f, l_raw = location_spec.rsplit("#", 1)
+
+        # Parse line or range
+        line: int
+        comment_range: Optional[CommentRange] = None
+
+        # Check for character range: L12C13-L12C19 (case insensitive)
+        char_range_match = _CHAR_RANGE_RE.match(l_raw)
+        if char_range_match:
+            start_line, start_char, end_line, end_char = map(int, char_range_match.groups())
+            line = end_line
+            comment_range = CommentRange(
+                start_line=start_line,
+                start_character=start_char,
+                end_line=end_line,
+                end_character=end_char,
+            )
+        elif "-" in l_raw:
+            try:
+                start, end = map(int, l_raw.split("-"))
+            except ValueError:
+                raise ValueError(
+                    f"Invalid line format '{l_raw}', expected 'line', 'start-end', or 'LnCm-LnCm'"
+                ) from None
+            line = end
+            comment_range = CommentRange(
+                start_line=start,
+                start_character=0,
+                end_line=end,
+                end_character=10000,
+            )
+        else:
+            try:
+                line = int(l_raw)
+            except ValueError:
+                raise ValueError(f"Invalid line number '{l_raw}'") from None
+
+        comments.setdefault(f, []).append(
+            CommentInput(line=line, message=m, range=comment_range)
+        )
+
+    return comments
@@ -1,15 +1,65 @@
 """JSON Formatter"""
 
-import json
-from typing import Optional
+import sys
+from typing import Any, Optional
+
+from pydantic import BaseModel
+from pydantic_core import to_json as _pydantic_to_json
 
 from gerrit_cli.client.models import Change, ChangeDetail
 from gerrit_cli.formatters.base import Formatter
 
+try:
+    # Optional fast JSON serializer (pip install gerrit-agent[fast])
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _model_dump(obj: Any) -> Any:
+    """orjson fallback for types it cannot serialize natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json(data: Any, pretty: Optional[bool] = None) -> str:
+    """Serialize data as JSON, keeping non-ASCII characters as-is
+
+    Pydantic models may appear anywhere in ``data`` and are written out by field
+    name, without converting them to dicts first.
+
+    Args:
+        data: JSON-compatible data (dicts, lists, str, int, bool, None, pydantic models)
+        pretty: Indent with 2 spaces, or emit compact single-line JSON when False.
+            None (default) indents only when stdout is a terminal, programs reading
+            the output get the cheaper compact form
+
+    Returns:
+        JSON string
+    """
+    if pretty is None:
+        pretty = sys.stdout.isatty()
+    if _HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        encoded: bytes = orjson.dumps(data, option=option, default=_model_dump)
+        return encoded.decode()
+    return _pydantic_to_json(data, indent=2 if pretty else None, by_alias=False).decode()
+
 
 class JsonFormatter(Formatter):
     """JSON formatter"""
 
+    def __init__(self, pretty: Optional[bool] = None) -> None:
+        """Initialize JSON formatter
+
+        Args:
+            pretty: Passed to to_json, None (default) indents only on a terminal
+        """
+        self.pretty = pretty
+
     def format_changes(
         self, changes: list[Change], has_more: bool = False, limit: Optional[int] = None
     ) -> str:
@@ -21,8 +71,7 @@ class JsonFormatter(Formatter):
         Returns:
             JSON string
         """
-        data = [change.model_dump(mode="json") for change in changes]
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return to_json(changes, pretty=self.pretty)
 
     def format_change_detail(self, change: ChangeDetail, show_comments: bool = False) -> str:
         """Format change detail as JSON
@@ -34,5 +83,4 @@ class JsonFormatter(Formatter):
         Returns:
             JSON string
         """
-        data = change.model_dump(mode="json")
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return to_json(change, pretty=self.pretty)
@@ -1,17 +1,81 @@
 """Table Formatter"""
 
+import re
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional, Dict, Union, Any
+from functools import lru_cache
+from itertools import groupby
+from typing import Optional, DefaultDict, Dict, Iterator, Union, Any
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from rich.rule import Rule
 
-from gerrit_cli.client.models import Change, ChangeDetail
+from gerrit_cli.client.models import SPECIAL_FILES, Change, ChangeDetail
 from gerrit_cli.formatters.base import Formatter
 from gerrit_cli.utils.helpers import shorten_path
 
+# 预构建的样式，避免每次 append 都重新解析样式字符串
+_S_CYAN = Style(color="cyan")
+_S_BOLD_CYAN = Style(color="cyan", bold=True)
+_S_GREEN = Style(color="green")
+_S_RED = Style(color="red")
+_S_WHITE = Style(color="white")
+_S_YELLOW = Style(color="yellow")
+_S_DIM = Style(dim=True)
+_S_BOLD_WHITE = Style(color="white", bold=True)
+_S_BOLD_YELLOW = Style(color="yellow", bold=True)
+_S_BOLD_MAGENTA_UL = Style(color="magenta", bold=True, underline=True)
+
+# diff 文件头分隔线
+_DIFF_SEPARATOR = "=" * 80
+
+# diff 行首字符到样式的映射（"@@" 行单独处理）
+_DIFF_LINE_STYLES = {"+": _S_GREEN, "-": _S_RED}
+
+# Gerrit 消息中的评论数标记，如 "(1 comment)"、"(3 comments)"
+_COMMENT_COUNT_RE = re.compile(r"\(\d+ comments?\)")
+
+# 非终端输出超过该行数时，format_changes 直接输出纯文本表格，跳过 Rich 布局
+PLAIN_TABLE_THRESHOLD = 200
+
+_CHANGE_COLUMNS = ("ID", "Subject", "Owner", "Project", "Status", "+/-", "Updated")
+
+
+@lru_cache(maxsize=4096)
+def _parse_gerrit_time(time_str: str) -> Optional[datetime]:
+    """Parse a Gerrit timestamp (cached, the same timestamps repeat across a render)
+
+    Args:
+        time_str: Gerrit time string (Format: 2025-01-01 00:00:00.000000000)
+
+    Returns:
+        Parsed datetime, or None if the string is not a valid timestamp
+    """
+    # Fixed layout, so parse by slicing instead of the (slow) strptime
+    t = time_str
+    try:
+        return datetime(
+            int(t[0:4]), int(t[5:7]), int(t[8:10]), int(t[11:13]), int(t[14:16]), int(t[17:19])
+        )
+    except (ValueError, TypeError):
+        return None
+
+
+def _diff_line_style(line: str) -> Style:
+    """Pick the highlight style of a unified diff line"""
+    if line.startswith("@@"):
+        return _S_BOLD_CYAN
+    return _DIFF_LINE_STYLES.get(line[:1], _S_WHITE)
+
+
+@lru_cache(maxsize=1024)
+def _message_body(message: str) -> str:
+    """Indent non-blank message lines (cached, messages repeat across renders)"""
+    return "".join(f"  {line}\n" for line in message.split("\n") if line.strip())
+
 
 class Section:
     """统一的 Section 组件，用于格式化 title + divider + content
@@ -19,18 +83,18 @@ class Section:
     提供一致的渲染方式，避免代码重复和不一致的格式化逻辑。
     """
 
-    def __init__(self, title: str, content: Union[Text, str, Table]):
+    def __init__(self, title: Union[Text, str], content: Union[Text, str, Table]):
         """初始化 Section
 
         Args:
-            title: Section 标题
+            title: Section 标题（str 使用 bold cyan 渲染，Text 按原样式渲染）
             content: Section 内容（支持 Text、str 或 Table）
         """
         self.title = title
         self.content = content
 
-    def render(self, console: Console) -> None:
-        """统一的渲染方法
+    def renderable(self) -> Group:
+        """构建 Section 的可渲染对象
 
         渲染格式：
         1. 空行
@@ -38,20 +102,31 @@ class Section:
         3. Rule 分割线（dim）
         4. Content
 
+        Returns:
+            包含以上各部分的 Rich Group，可与其他 Section 合并后一次性打印
+        """
+        title = self.title if isinstance(self.title, Text) else f"[bold cyan]{self.title}[/bold cyan]"
+        return Group(Text(), title, Rule(style="dim"), self.content)
+
+    def render(self, console: Console) -> None:
+        """统一的渲染方法
+
         Args:
             console: Rich Console 对象
         """
-        console.print()  # 添加空行
-        console.print(f"[bold cyan]{self.title}[/bold cyan]")
-        console.print(Rule(style="dim"))
-        console.print(self.content)
+        console.print(self.renderable())
 
 
 class TableFormatter(Formatter):
     """Table formatter using rich"""
 
+    # 所有实例共享一个 Console，避免每次构造都重新探测终端能力
+    _shared_console: Optional[Console] = None
+
     def __init__(self) -> None:
-        self.console = Console()
+        if TableFormatter._shared_console is None:
+            TableFormatter._shared_console = Console()
+        self.console = TableFormatter._shared_console
 
     def format_changes(
         self, changes: list[Change], has_more: bool = False, limit: Optional[int] = None
@@ -67,13 +142,36 @@ class TableFormatter(Formatter):
         if not changes:
             return "No changes found"
 
+        # Precompute each column in its own comprehension, then feed rows by zip
+        format_time = self._format_time
+        now = datetime.now()
+        owners = [change.owner for change in changes]
+        columns = (
+            [change.display_id for change in changes],
+            [change.subject[:80] for change in changes],  # Limit length
+            [(owner.name or owner.username or "") if owner else "" for owner in owners],
+            [change.project for change in changes],
+            [change.status for change in changes],
+            [f"+{change.insertions}/-{change.deletions}" for change in changes],
+            [format_time(change.updated, now) for change in changes],
+        )
+
+        # Large lists going to a pipe/agent: skip Rich layout and emit plain text
+        if not self.console.is_terminal and len(changes) > PLAIN_TABLE_THRESHOLD:
+            title = f"Changes ({len(changes)} items)"
+            if has_more:
+                title += " (more available)"
+            if limit:
+                title += f" (limit: {limit})"
+            return self._format_plain_table(title, _CHANGE_COLUMNS, columns)
+
         # Build title
         title = f"Changes ({len(changes)} items)"
         if has_more:
             title += " [yellow](more available)[/yellow]"
         if limit:
             title += f" (limit: {limit})"
- 
+
         table = Table(title=title)
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Subject", style="white")
@@ -83,26 +181,11 @@ class TableFormatter(Formatter):
         table.add_column("+/-", style="blue", no_wrap=True)
         table.add_column("Updated", style="dim")
 
-        for change in changes:
-            owner_name = ""
-            if change.owner:
-                owner_name = change.owner.name or change.owner.username or ""
-
-            # Format insertions/deletions
-            changes_text = f"+{change.insertions}/-{change.deletions}"
-
-            # Format updated time
-            updated = self._format_time(change.updated)
-
-            table.add_row(
-                change.display_id,
-                change.subject[:80],  # Limit length
-                owner_name,
-                change.project,
-                change.status,
-                changes_text,
-                updated,
-            )
+        # Pre-render cells as Text: str cells would be markup-parsed by Rich on both the
+        # measure and render passes (and brackets in subjects misread as markup)
+        add_row = table.add_row
+        for row in zip(*columns):
+            add_row(*map(Text, row))
 
         # Capture console output
         with self.console.capture() as capture:
@@ -110,6 +193,31 @@ class TableFormatter(Formatter):
 
         return capture.get()
 
+    def _format_plain_table(
+        self, title: str, headers: tuple[str, ...], columns: tuple[list[str], ...]
+    ) -> str:
+        """Format columns as a plain, space-aligned text table (no Rich)
+
+        Args:
+            title: Table title
+            headers: Column headers
+            columns: Column values, one list per header
+
+        Returns:
+            Plain text table string
+        """
+        widths = [
+            max(len(header), max(map(len, column), default=0))
+            for header, column in zip(headers, columns)
+        ]
+        rows = [headers, *zip(*columns)]
+        lines = [title]
+        lines.extend(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in rows
+        )
+        return "\n".join(lines) + "\n"
+
     def format_change_detail(self, change: ChangeDetail, show_comments: bool = False) -> str:
         """Format change details
 
@@ -121,19 +229,19 @@ class TableFormatter(Formatter):
             Formatted detail string
         """
         # Title
-        title_text = Text()
-        title_text.append(f"Change {change.display_id}: ", style="bold cyan")
-        title_text.append(change.subject, style="bold white")
-
-        # Basic Info content
-        info_content = Text()
-        info_content.append(f"Project: {change.project}\n")
-        info_content.append(f"Branch: {change.branch}\n")
-        info_content.append(f"Status: {change.status}\n")
-        info_content.append(f"Owner: {change.owner.name if change.owner else 'Unknown'}\n")
-        info_content.append(f"Created: {self._format_time(change.created)}\n")
-        info_content.append(f"Updated: {self._format_time(change.updated)}\n")
-        info_content.append(f"Changes: +{change.insertions}/-{change.deletions}\n")
+        title_text = self._make_title(change)
+
+        # Basic Info content（无样式，拼接为一个字符串）
+        now = datetime.now()
+        info_lines = [
+            f"Project: {change.project}\n",
+            f"Branch: {change.branch}\n",
+            f"Status: {change.status}\n",
+            f"Owner: {change.owner.name if change.owner else 'Unknown'}\n",
+            f"Created: {self._format_time(change.created, now)}\n",
+            f"Updated: {self._format_time(change.updated, now)}\n",
+            f"Changes: +{change.insertions}/-{change.deletions}\n",
+        ]
 
         # Label Labels
         if change.labels:
@@ -141,26 +249,31 @@ class TableFormatter(Formatter):
             for label_name, label_info in change.labels.items():
                 value = label_info.value if label_info.value is not None else 0
                 label_text.append(f"{label_name}: {value:+d}")
-            info_content.append(f"Labels: {', '.join(label_text)}\n")
+            info_lines.append(f"Labels: {', '.join(label_text)}\n")
+
+        info_content = Text("".join(info_lines))
 
         info_section = self._format_section("Basic Info", info_content)
 
         # Message History
         sections = [info_section]
         if change.messages:
-            messages_content = Text()
-            for msg in change.messages[-5:]:  # Show only last 5 messages
-                author_name = msg.author.name if msg.author else "Unknown"
-                messages_content.append(f"[{self._format_time(msg.date)}] {author_name}:\n")
-                messages_content.append(f"  {msg.message[:200]}\n\n")
+            # 无样式内容：拼接为一个字符串，避免逐条 append
+            format_time = self._format_time
+            messages_content = Text(
+                "".join(
+                    f"[{format_time(msg.date, now)}] "
+                    f"{msg.author.name if msg.author else 'Unknown'}:\n"
+                    f"  {msg.message[:200]}\n\n"
+                    for msg in change.messages[-5:]  # Show only last 5 messages
+                )
+            )
             messages_section = self._format_section("Recent Messages", messages_content)
             sections.append(messages_section)
 
-        # Capture Output - 使用统一的 Section.render() 方法
+        # Capture Output - 所有 Section 合并为一个 Group，一次性打印
         with self.console.capture() as capture:
-            self.console.print(title_text)
-            for section in sections:
-                section.render(self.console)
+            self.console.print(Group(title_text, *(section.renderable() for section in sections)))
 
         return capture.get()
 
@@ -197,6 +310,8 @@ class TableFormatter(Formatter):
             }
 
         parts: list[Section] = []
+        # 只查询一次控制台宽度，传给需要缩短路径的各个部分
+        console_width = self.console.width
 
         # ========== 元数据部分 ==========
         if show_parts.get("metadata", False):
@@ -204,11 +319,11 @@ class TableFormatter(Formatter):
 
         # ========== 文件列表部分 ==========
         if show_parts.get("files", False) and files:
-            parts.append(self._render_files_panel(files, change))
+            parts.append(self._render_files_panel(files, change, console_width))
 
         # ========== 评论部分 (提前到 FILES 之后) ==========
         if show_parts.get("comments", False) and comments:
-            parts.append(self._render_comments_panel(comments))
+            parts.append(self._render_comments_panel(comments, console_width))
 
         # ========== 消息历史部分 ==========
         if show_parts.get("messages", False) and change.messages:
@@ -218,58 +333,79 @@ class TableFormatter(Formatter):
         if show_parts.get("diff", False) and diffs:
             parts.append(self._render_diffs_panel(diffs, context=context))
 
-        # 合并所有部分 - 使用统一的 Section.render() 方法
+        # 没有任何部分需要渲染时直接返回，省去 capture 的开销
+        if not parts:
+            return ""
+
+        # 合并所有部分 - 合并为一个 Group，一次性打印
         with self.console.capture() as capture:
-            for section in parts:
-                section.render(self.console)
+            self.console.print(Group(*(section.renderable() for section in parts)))
 
         return capture.get()
 
+    def _make_title(self, change: ChangeDetail, show_status: bool = False) -> Text:
+        """Build the styled change title, e.g. 'Change 123: Subject  [NEW]'"""
+        title = Text.assemble(
+            (f"Change {change.display_id}: ", _S_BOLD_CYAN), (change.subject, _S_BOLD_WHITE)
+        )
+        if show_status:
+            title.append(f"  [{change.status}]", style=_S_BOLD_YELLOW)
+        return title
+
     def _render_metadata_panel(self, change: ChangeDetail) -> Section:
         """Render metadata section"""
         # 标题
-        title_text = f"Change {change.display_id}: {change.subject}  [{change.status}]"
-
-        # 内容
-        content = Text()
-        content.append("Project: ", style="cyan")
-        content.append(f"{change.project}\n")
-        content.append("Branch:  ", style="cyan")
-        content.append(f"{change.branch}\n")
-        content.append("Owner:   ", style="cyan")
-        content.append(f"{change.owner.name if change.owner else 'Unknown'}\n")
-        content.append("Created: ", style="cyan")
-        content.append(f"{self._format_time(change.created)}\n", style="dim")
-        content.append("Updated: ", style="cyan")
-        content.append(f"{self._format_time(change.updated)}\n", style="dim")
-        content.append("Changes: ", style="cyan")
-        content.append(f"+{change.insertions}/-{change.deletions}\n", style="green")
+        title_text = self._make_title(change, show_status=True)
+
+        # 内容：先收集 (文本, 样式) 片段，最后一次性组装
+        now = datetime.now()
+        segments: list[Union[str, tuple[str, Style]]] = [
+            ("Project: ", _S_CYAN),
+            f"{change.project}\n",
+            ("Branch:  ", _S_CYAN),
+            f"{change.branch}\n",
+            ("Owner:   ", _S_CYAN),
+            f"{change.owner.name if change.owner else 'Unknown'}\n",
+            ("Created: ", _S_CYAN),
+            (f"{self._format_time(change.created, now)}\n", _S_DIM),
+            ("Updated: ", _S_CYAN),
+            (f"{self._format_time(change.updated, now)}\n", _S_DIM),
+            ("Changes: ", _S_CYAN),
+            (f"+{change.insertions}/-{change.deletions}\n", _S_GREEN),
+        ]
 
         # Labels
         if change.labels:
-            content.append("\nLabels:\n", style="bold cyan")
+            segments.append(("\nLabels:\n", _S_BOLD_CYAN))
             for label_name, label_info in change.labels.items():
                 value = label_info.value if label_info.value is not None else 0
-                color = "green" if value > 0 else "red" if value < 0 else "white"
-                content.append(f"  • {label_name}: ", style="white")
-                content.append(f"{value:+d}\n", style=color)
+                color = _S_GREEN if value > 0 else _S_RED if value < 0 else _S_WHITE
+                segments.append((f"  • {label_name}: ", _S_WHITE))
+                segments.append((f"{value:+d}\n", color))
+
+        content = Text.assemble(*segments)
 
         return self._format_section(title_text, content)
 
     def _render_files_panel(
-        self, files: Dict[str, Any], change: ChangeDetail
+        self, files: Dict[str, Any], change: ChangeDetail, console_width: Optional[int] = None
     ) -> Section:
         """Render files list section
 
-        Returns tuple of (title, divider_char, table) for caller to print
+        Args:
+            files: File list data
+            change: ChangeDetail object
+            console_width: Console width (queried from the console if not given)
         """
-        file_count = len([f for f in files.keys() if f not in ["/COMMIT_MSG", "/MERGE_LIST"]])
+        file_count = sum(1 for f in files if f not in SPECIAL_FILES)
         title = f"FILES CHANGED ({file_count} files, +{change.insertions}/-{change.deletions})"
 
         # Calculate available width for the file path
         # Console width - borders/padding (4) - Status (3) - Changes (15) - spacings
         # Default Console width is 80 if not detectable
-        available_width = self.console.width - 26
+        if console_width is None:
+            console_width = self.console.width
+        available_width = console_width - 26
         if available_width < 20:
             available_width = 20  # Minimum safeguard
 
@@ -281,7 +417,7 @@ class TableFormatter(Formatter):
 
         for file_path, file_info in files.items():
             # 跳过特殊文件
-            if file_path in ["/COMMIT_MSG", "/MERGE_LIST"]:
+            if file_path in SPECIAL_FILES:
                 continue
 
             # 文件状态
@@ -297,7 +433,7 @@ class TableFormatter(Formatter):
         return self._format_section(title, table)
 
     def _render_diffs_panel(
-        self, diffs: Dict[str, Any], context: int = 5
+        self, diffs: Dict[str, Any], context: Optional[int] = 5
     ) -> Section:
         """Render diff section
 
@@ -306,74 +442,75 @@ class TableFormatter(Formatter):
             context: Number of context lines for changes (default: 5)
         """
         content = Text()
+        append = content.append
 
         for file_path, diff_data in diffs.items():
             # 文件头
-            content.append(f"\n{'=' * 80}\n", style="dim")
-            content.append(f"diff --git a/{file_path} b/{file_path}\n", style="bold white")
-            content.append(f"{'=' * 80}\n", style="dim")
-
-            # 转换 Gerrit diff 为 unified diff 格式，限制上下文行数
-            unified_diff = self._convert_gerrit_diff_to_unified(diff_data, context=context)
-
-            # 语法高亮显示 diff
-            for line in unified_diff.split("\n"):
-                if line.startswith("@@"):
-                    content.append(line + "\n", style="cyan bold")
-                elif line.startswith("+"):
-                    content.append(line + "\n", style="green")
-                elif line.startswith("-"):
-                    content.append(line + "\n", style="red")
-                else:
-                    content.append(line + "\n", style="white")
+            append(f"\n{_DIFF_SEPARATOR}\n", style=_S_DIM)
+            append(f"diff --git a/{file_path} b/{file_path}\n", style=_S_BOLD_WHITE)
+            append(f"{_DIFF_SEPARATOR}\n", style=_S_DIM)
+
+            # 转换 Gerrit diff 为 unified diff 行，限制上下文行数（空 diff 保留一个空行）
+            diff_lines = list(self._iter_unified_lines(diff_data, context=context)) or [""]
+
+            # 语法高亮显示 diff：连续同样式的行合并为一次 append
+            for style, run in groupby(diff_lines, key=_diff_line_style):
+                append("\n".join(run) + "\n", style=style)
 
         return self._format_section("DIFF", content)
 
     def _render_messages_panel(self, messages: list[Any]) -> Section:
         """Render messages history section"""
-        content = Text()
+        segments: list[Union[str, tuple[str, Style]]] = []
+        append = segments.append
+        format_time = self._format_time
+        now = datetime.now()
 
         # 只显示最近 8 条消息（增加一些可见度）
-        recent_messages = messages[-8:] if len(messages) > 8 else messages
-
-        for msg in recent_messages:
-            author_name = msg.author.name if msg.author else "Unknown"
-            time_str = self._format_time(msg.date)
+        for msg in messages[-8:]:
+            author = msg.author
+            author_name = author.name if author else "Unknown"
+            message = msg.message
 
-            content.append(f"[{time_str}] ", style="dim")
-            content.append(f"{author_name}:", style="bold cyan")
+            append((f"[{format_time(msg.date, now)}] ", _S_DIM))
+            append((f"{author_name}:", _S_BOLD_CYAN))
 
             # 标记包含评论的消息
-            if "(1 comment)" in msg.message or " comments)" in msg.message:
-                 content.append(" 💬", style="yellow")
+            if _COMMENT_COUNT_RE.search(message):
+                append((" 💬", _S_YELLOW))
 
-            content.append("\n")
-
-            # 处理消息内容（可能有多行）
-            for line in msg.message.split("\n"):
-                if line.strip():
-                    content.append(f"  {line}\n")
-
-            content.append("\n")
+            # 处理消息内容（可能有多行），合并为一个片段
+            append(f"\n{_message_body(message)}\n")
 
+        content = Text.assemble(*segments)
         title = f"RECENT MESSAGES ({len(messages)})"
         return self._format_section(title, content)
 
     def _render_comments_panel(
-        self, comments: Dict[str, Any]
+        self, comments: Dict[str, Any], console_width: Optional[int] = None
     ) -> Section:
-        """Render comments section, grouped by file, line number and author"""
-        content = Text()
+        """Render comments section, grouped by file, line number and author
 
-        if not comments:
+        Args:
+            comments: Comments data
+            console_width: Console width (queried from the console if not given)
+        """
+        # 所有文件的评论列表都为空时，与没有评论同样处理
+        if not comments or not any(comments.values()):
             no_comments_text = Text("No inline comments")
             return self._format_section("INLINE COMMENTS", no_comments_text)
 
+        content = Text()
+        append = content.append
+        format_time = self._format_time
+        now = datetime.now()
         file_count = 0
         comment_count = 0
 
         # 计算可用宽度用于缩短路径
-        available_width = self.console.width - 15
+        if console_width is None:
+            console_width = self.console.width
+        available_width = console_width - 15
         if available_width < 20:
             available_width = 20
 
@@ -386,59 +523,76 @@ class TableFormatter(Formatter):
 
             # 缩短文件路径，并作为文件头展示
             display_path = shorten_path(file_path, max_length=available_width)
-            content.append(f"\n{display_path}\n", style="bold magenta underline")
+            append(f"\n{display_path}\n", style=_S_BOLD_MAGENTA_UL)
 
-            # 按行号对评论进行预分组
-            line_groups: Dict[Any, list[Any]] = {}
+            # 按行号对评论进行预分组：行级评论按整数行号分桶，文件级评论单独收集
+            line_groups: DefaultDict[int, list[Any]] = defaultdict(list)
+            file_comments: list[Any] = []
             for comment in comment_list:
-                line = comment.line if comment.line else "File"
-                if line not in line_groups:
-                    line_groups[line] = []
-                line_groups[line].append(comment)
-
-            # 按行号排序并展示
-            sorted_lines = sorted(
-                line_groups.keys(),
-                key=lambda x: (0, int(x)) if isinstance(x, int) or (isinstance(x, str) and x.isdigit()) else (1, x)
-            )
+                line = comment.line
+                if line:
+                    line_groups[line].append(comment)
+                else:
+                    file_comments.append(comment)
+
+            # 行号升序展示，文件级评论排在最后
+            groups = [(f"Line {line}", line_groups[line]) for line in sorted(line_groups)]
+            if file_comments:
+                groups.append(("File", file_comments))
 
-            for line in sorted_lines:
+            for line_text, line_comments in groups:
                 # 行号标题（缩进一层）
-                line_text = f"Line {line}" if isinstance(line, int) or str(line).isdigit() else line
-                content.append(f"  {line_text}:\n", style="bold yellow")
+                append(f"  {line_text}:\n", style=_S_BOLD_YELLOW)
 
                 # 在该行内按作者归并
-                author_groups: Dict[str, list[Any]] = {}
-                for comment in line_groups[line]:
-                    author = comment.author.name if comment.author else "Unknown"
-                    if author not in author_groups:
-                        author_groups[author] = []
-                    author_groups[author].append(comment)
-
-                for author, author_comments in author_groups.items():
+                author_groups: DefaultDict[str, list[Any]] = defaultdict(list)
+                for comment in line_comments:
+                    author = comment.author
+                    author_groups[author.name if author else "Unknown"].append(comment)
+
+                for author_name, author_comments in author_groups.items():
                     # 取最后一条评论的时间
                     last_updated = author_comments[-1].updated
-                    time_str = f" [{self._format_time(last_updated)}]" if last_updated else ""
+                    time_str = f" [{format_time(last_updated, now)}]" if last_updated else ""
 
                     # 展示作者（缩进两层）
-                    content.append(f"    {author}{time_str}:\n", style="bold cyan")
+                    append(f"    {author_name}{time_str}:\n", style=_S_BOLD_CYAN)
 
-                    # 展示该作者的所有评论内容（缩进三层）
+                    # 展示该作者的所有评论内容（缩进三层），合并为一次 append
+                    body: list[str] = []
                     for comment in author_comments:
                         lines = comment.message.split("\n")
-                        for i, line in enumerate(lines):
-                            if line.strip() or i < len(lines) - 1:
-                                content.append(f"      {line}\n")
-                    content.append("\n")
+                        last = len(lines) - 1
+                        body.extend(
+                            f"      {line}\n"
+                            for i, line in enumerate(lines)
+                            if line.strip() or i < last
+                        )
+                    body.append("\n")
+                    append("".join(body))
 
         title = f"INLINE COMMENTS ({comment_count} comments in {file_count} files)"
         return self._format_section(title, content)
 
     def _convert_gerrit_diff_to_unified(
-        self, gerrit_diff: Dict[str, Any], context: int = 5
+        self, gerrit_diff: Dict[str, Any], context: Optional[int] = 5
     ) -> str:
         """Convert Gerrit diff format to unified diff format with limited context lines
 
+        Args:
+            gerrit_diff: Gerrit diff data
+            context: Number of context lines for changes (see _iter_unified_lines)
+
+        Returns:
+            Unified diff format string
+        """
+        return "\n".join(self._iter_unified_lines(gerrit_diff, context=context))
+
+    def _iter_unified_lines(
+        self, gerrit_diff: Dict[str, Any], context: Optional[int] = 5
+    ) -> Iterator[str]:
+        """Yield unified diff lines for a Gerrit diff, with limited context lines
+
         Gerrit diff format:
         {
             "content": [
@@ -450,14 +604,35 @@ class TableFormatter(Formatter):
 
         Args:
             gerrit_diff: Gerrit diff data
-            context: Number of context lines for changes (lines on each side)
+            context: Number of context lines for changes (lines on each side).
+                0 shows only changed lines, None shows all context lines.
 
-        Returns:
-            Unified diff format string
+        Yields:
+            Unified diff lines (without trailing newline)
         """
-        lines = []
         content_sections = gerrit_diff.get("content", [])
 
+        # 常见调用的特化路径：无上下文 / 完整上下文，无需判断 section 位置
+        if context is None or context == 0:
+            for section in content_sections:
+                if "ab" in section:
+                    if context is None:
+                        yield from map(" ".__add__, section["ab"])
+                    elif section["ab"]:
+                        yield f"@@ ... skipped {len(section['ab'])} lines ... @@"
+                elif "skip" in section:
+                    yield f"@@ ... skipped {section['skip']} lines ... @@"
+                else:
+                    if "a" in section:
+                        yield from map("-".__add__, section["a"])
+                    if "b" in section:
+                        yield from map("+".__add__, section["b"])
+            return
+
+        n = len(content_sections)
+        # 预先计算每个 section 是否包含改动（a/b），避免循环中反复查看前后 section
+        is_change = ["a" in section or "b" in section for section in content_sections]
+
         for i, section in enumerate(content_sections):
             if "ab" in section:
                 # 上下文行（未修改）
@@ -465,119 +640,93 @@ class TableFormatter(Formatter):
                 total_lines = len(ab_lines)
 
                 # 判断这个 ab section 的位置：是否在改动前后
-                is_before_change = i < len(content_sections) - 1 and self._is_change_section(
-                    content_sections[i + 1]
-                )
-                is_after_change = i > 0 and self._is_change_section(content_sections[i - 1])
+                is_before_change = i + 1 < n and is_change[i + 1]
+                is_after_change = i > 0 and is_change[i - 1]
 
                 if is_before_change and is_after_change:
                     # 在两个改动之间：显示前一个改动的后 context 行 + 后一个改动的前 context 行
                     if total_lines > context * 2:
                         # 只保留前 context 行和后 context 行
-                        for line in ab_lines[:context]:
-                            lines.append(f" {line}")
-                        lines.append(f"@@ ... skipped {total_lines - context * 2} lines ... @@")
-                        for line in ab_lines[-context:]:
-                            lines.append(f" {line}")
+                        yield from map(" ".__add__, ab_lines[:context])
+                        yield f"@@ ... skipped {total_lines - context * 2} lines ... @@"
+                        yield from map(" ".__add__, ab_lines[-context:])
                     else:
                         # 全部显示
-                        for line in ab_lines:
-                            lines.append(f" {line}")
+                        yield from map(" ".__add__, ab_lines)
                 elif is_before_change:
                     # 在改动之前：只显示最后 context 行
                     if total_lines > context:
-                        lines.append(f"@@ ... skipped {total_lines - context} lines ... @@")
-                        for line in ab_lines[-context:]:
-                            lines.append(f" {line}")
+                        yield f"@@ ... skipped {total_lines - context} lines ... @@"
+                        yield from map(" ".__add__, ab_lines[-context:])
                     else:
-                        for line in ab_lines:
-                            lines.append(f" {line}")
+                        yield from map(" ".__add__, ab_lines)
                 elif is_after_change:
                     # 在改动之后：只显示前 context 行
                     if total_lines > context:
-                        for line in ab_lines[:context]:
-                            lines.append(f" {line}")
-                        lines.append(f"@@ ... skipped {total_lines - context} lines ... @@")
+                        yield from map(" ".__add__, ab_lines[:context])
+                        yield f"@@ ... skipped {total_lines - context} lines ... @@"
                     else:
-                        for line in ab_lines:
-                            lines.append(f" {line}")
+                        yield from map(" ".__add__, ab_lines)
                 else:
                     # 孤立的 ab section（不在任何改动附近）：完全跳过或显示部分
                     if total_lines > context * 2:
-                        lines.append(f"@@ ... skipped {total_lines} lines ... @@")
+                        yield f"@@ ... skipped {total_lines} lines ... @@"
                     else:
-                        for line in ab_lines:
-                            lines.append(f" {line}")
+                        yield from map(" ".__add__, ab_lines)
 
             elif "skip" in section:
                 # Gerrit 已经提供的跳过信息
-                lines.append(f"@@ ... skipped {section['skip']} lines ... @@")
-            elif "a" in section and "b" in section:
-                # 修改的行（先删除后添加）
-                for line in section["a"]:
-                    lines.append(f"-{line}")
-                for line in section["b"]:
-                    lines.append(f"+{line}")
-            elif "a" in section:
-                # 仅删除的行
-                for line in section["a"]:
-                    lines.append(f"-{line}")
-            elif "b" in section:
-                # 仅添加的行
-                for line in section["b"]:
-                    lines.append(f"+{line}")
-
-        return "\n".join(lines)
-
-    def _is_change_section(self, section: Dict[str, Any]) -> bool:
-        """Check if a section contains changes (not pure context)"""
-        return "a" in section or "b" in section
-
-    def _format_time(self, time_str: str) -> str:
+                yield f"@@ ... skipped {section['skip']} lines ... @@"
+            else:
+                # 修改的行（先删除后添加），也覆盖仅删除/仅添加的情况
+                if "a" in section:
+                    yield from map("-".__add__, section["a"])
+                if "b" in section:
+                    yield from map("+".__add__, section["b"])
+
+    def _format_time(self, time_str: str, now: Optional[datetime] = None) -> str:
         """Format time string
 
         Args:
             time_str: Gerrit time string (Format: 2025-01-01 00:00:00.000000000)
+            now: Reference time (default: datetime.now()); pass one value to reuse it
+                across a whole render
 
         Returns:
             Formatted time string
         """
-        try:
-            # Gerrit Time Format: 2025-01-01 00:00:00.000000000
-            # Remove nanoseconds
-            if "." in time_str:
-                time_str = time_str.split(".")[0]
-
-            dt = datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-
-            # Calculate time difference
-            now = datetime.now()
-            diff = now - dt
-
-            if diff.days > 365:
-                return f"{diff.days // 365} years ago"
-            elif diff.days > 30:
-                return f"{diff.days // 30} months ago"
-            elif diff.days > 0:
-                return f"{diff.days} days ago"
-            elif diff.seconds > 3600:
-                return f"{diff.seconds // 3600} hours ago"
-            elif diff.seconds > 60:
-                return f"{diff.seconds // 60} minutes ago"
-            else:
-                return "Just now"
-        except Exception:
+        dt = _parse_gerrit_time(time_str)
+        if dt is None:
             return time_str
 
+        # Calculate time difference
+        diff = (now or datetime.now()) - dt
+
+        if diff.days > 365:
+            return f"{diff.days // 365} years ago"
+        elif diff.days > 30:
+            return f"{diff.days // 30} months ago"
+        elif diff.days > 0:
+            return f"{diff.days} days ago"
+        elif diff.seconds > 3600:
+            return f"{diff.seconds // 3600} hours ago"
+        elif diff.seconds > 60:
+            return f"{diff.seconds // 60} minutes ago"
+        else:
+            return "Just now"
+
     def _format_section(
-        self, title: str, content: Union[Text, str, Table, None] = None, divider_char: str = "─"
+        self,
+        title: Union[Text, str],
+        content: Union[Text, str, Table, None] = None,
+        divider_char: str = "─",
     ) -> Section:
         """Format a section with title + divider + content (LLM-friendly format)
 
         使用统一的 Section 组件，确保所有部分使用一致的格式化方式。
 
         Args:
-            title: Section title
+            title: Section title (str or pre-styled Text)
             content: Section content (Text, str, Table, or None)
             divider_char: Character used for divider line (deprecated, kept for compatibility)
 
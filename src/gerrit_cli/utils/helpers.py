@@ -1,7 +1,9 @@
 """Helper Functions"""
 
+import os
 import subprocess
-from typing import Optional, Tuple, Union
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterator, Optional, Tuple
 
 
 class GitOperationError(Exception):
@@ -10,6 +12,11 @@ class GitOperationError(Exception):
     pass
 
 
+def _decode(output: bytes) -> str:
+    """Decode Git output as UTF-8 (independent of the locale, never raises)"""
+    return output.decode("utf-8", "replace").strip()
+
+
 def run_git_command(command: list[str], cwd: Optional[str] = None) -> Tuple[bool, str]:
     """Run Git Command
 
@@ -25,14 +32,85 @@ def run_git_command(command: list[str], cwd: Optional[str] = None) -> Tuple[bool
             command,
             cwd=cwd,
             capture_output=True,
-            text=True,
             check=False,
         )
-        return result.returncode == 0, result.stdout.strip()
+        return result.returncode == 0, _decode(result.stdout)
     except Exception as e:
         return False, str(e)
 
 
+def _git(command: list[str], cwd: Optional[str] = None) -> str:
+    """Run Git Command, raising on failure
+
+    Args:
+        command: List of Git command arguments (e.g. ['git', 'status'])
+        cwd: Working directory (optional)
+
+    Returns:
+        Command output
+
+    Raises:
+        GitOperationError: Command failed (message is git's error output)
+    """
+    try:
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            capture_output=True,
+            check=False,
+        )
+    except Exception as e:
+        raise GitOperationError(str(e)) from e
+    if result.returncode != 0:
+        raise GitOperationError(_decode(result.stderr) or _decode(result.stdout))
+    return _decode(result.stdout)
+
+
+def run_git_command_status(command: list[str], cwd: Optional[str] = None) -> bool:
+    """Run Git Command, only checking whether it succeeded
+
+    Output is discarded instead of captured and decoded.
+
+    Args:
+        command: List of Git command arguments (e.g. ['git', 'status'])
+        cwd: Working directory (optional)
+
+    Returns:
+        True if the command exited successfully
+    """
+    try:
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _run_cached_git_query(cwd: str, *command: str) -> Tuple[bool, str]:
+    """Run a read-only Git query once per working directory"""
+    return run_git_command(list(command), cwd=cwd)
+
+
+def _git_query(command: list[str], cwd: Optional[str] = None) -> Tuple[bool, str]:
+    """Run a read-only Git query, reusing the result within this process
+
+    Repo root, current branch and remotes do not change during a single CLI
+    invocation unless we change them ourselves, see _clear_git_caches().
+    """
+    return _run_cached_git_query(os.path.abspath(cwd or "."), *command)
+
+
+def _clear_git_caches() -> None:
+    """Forget cached Git query results (call after mutating repository state)"""
+    _run_cached_git_query.cache_clear()
+
+
 def check_git_repository(path: str = ".") -> bool:
     """Check if current directory is a Git repository
 
@@ -42,7 +120,7 @@ def check_git_repository(path: str = ".") -> bool:
     Returns:
         True if it is a Git repository
     """
-    success, _ = run_git_command(["git", "rev-parse", "--git-dir"], cwd=path)
+    success, _ = _git_query(["git", "rev-parse", "--git-dir"], cwd=path)
     return success
 
 
@@ -52,31 +130,118 @@ def get_current_branch() -> Optional[str]:
     Returns:
         Branch name, or None if not on a branch
     """
-    success, output = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+    success, output = _git_query(["git", "rev-parse", "--abbrev-ref", "HEAD"])
     if success and output != "HEAD":
         return output
     return None
 
 
+def gather_repo_state(remote_name: str = "origin") -> Dict[str, Any]:
+    """Probe repository state with concurrent Git processes
+
+    All probes are started before any of them is waited on, so the total
+    time is that of the slowest probe rather than the sum of all of them.
+
+    Args:
+        remote_name: Remote whose URL to look up (default: origin)
+
+    Returns:
+        Dict with keys "is_repo" (bool), "root", "branch" and "remote_url"
+        (str, or None if unavailable; "branch" is None on a detached HEAD)
+    """
+    probes = {
+        "is_repo": ["git", "rev-parse", "--git-dir"],
+        "root": ["git", "rev-parse", "--show-toplevel"],
+        "branch": ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        "remote_url": ["git", "remote", "get-url", remote_name],
+    }
+    outputs: Dict[str, Optional[str]] = dict.fromkeys(probes)
+    processes: Dict[str, "subprocess.Popen[bytes]"] = {}
+    launched = False
+    try:
+        for key, command in probes.items():
+            processes[key] = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        launched = True
+    except OSError:
+        # Git could not be started, every probe is reported as unavailable
+        launched = False
+    finally:
+        # Always reap the probes that did start, stopping them if their result is unused
+        for key, process in processes.items():
+            if not launched:
+                process.kill()
+            stdout, _ = process.communicate()
+            if launched and process.returncode == 0:
+                outputs[key] = _decode(stdout)
+
+    branch = outputs["branch"]
+    return {
+        "is_repo": outputs["is_repo"] is not None,
+        "root": outputs["root"],
+        "branch": branch if branch != "HEAD" else None,
+        "remote_url": outputs["remote_url"],
+    }
+
+
+def _iter_nul_records(stream: IO[bytes], chunk_size: int = 65536) -> Iterator[bytes]:
+    """Yield NUL terminated records from a binary pipe as they arrive"""
+    pending = b""
+    # os.read returns whatever is available instead of waiting for a full chunk
+    while chunk := os.read(stream.fileno(), chunk_size):
+        *records, pending = (pending + chunk).split(b"\0")
+        yield from records
+    if pending:
+        yield pending
+
+
 def check_working_directory_clean() -> Tuple[bool, str]:
     """Check if working directory is clean (no uncommitted changes)
 
     Returns:
         Tuple of (Is Clean, Status Description)
     """
-    success, output = run_git_command(["git", "status", "--porcelain"])
-    if not success:
+    # porcelain v2 has fixed columns and -z avoids path quoting; records are
+    # classified as raw bytes while git is still writing, file names are never decoded
+    staged = unstaged = untracked = 0
+    has_records = False
+    skip_next = False
+    try:
+        with subprocess.Popen(
+            ["git", "status", "--porcelain=v2", "-z"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ) as process:
+            if process.stdout is None:
+                return False, "Failed to check Git status"
+            for record in _iter_nul_records(process.stdout):
+                has_records = True
+                if skip_next:
+                    # Original path of a rename/copy record
+                    skip_next = False
+                    continue
+                kind = record[:1]
+                if kind == b"1" or kind == b"2":
+                    # "<kind> <X><Y> ...", "." means unchanged
+                    if record[2:3] != b".":
+                        staged += 1
+                    if record[3:4] != b".":
+                        unstaged += 1
+                    skip_next = kind == b"2"
+                elif kind == b"?":
+                    untracked += 1
+                elif kind == b"u":
+                    # Unmerged paths still need to be resolved in the work tree
+                    unstaged += 1
+    except OSError:
+        return False, "Failed to check Git status"
+    if process.returncode != 0:
         return False, "Failed to check Git status"
 
-    if not output:
+    if not has_records:
         return True, "Working directory clean"
 
-    # Count changes
-    lines = output.strip().split("\n")
-    staged = sum(1 for line in lines if line[0] in "MADRC")
-    unstaged = sum(1 for line in lines if line[1] in "MD")
-    untracked = sum(1 for line in lines if line.startswith("??"))
-
     status_parts = []
     if staged > 0:
         status_parts.append(f"{staged} staged changes")
@@ -101,10 +266,11 @@ def stash_changes(include_untracked: bool = True) -> Tuple[bool, str]:
     if include_untracked:
         command.append("--include-untracked")
 
-    success, output = run_git_command(command)
-    if success:
-        return True, "Stashed current changes"
-    return False, f"Stash failed: {output}"
+    try:
+        _git(command)
+    except GitOperationError as e:
+        return False, f"Stash failed: {e}"
+    return True, "Stashed current changes"
 
 
 def pop_stash() -> Tuple[bool, str]:
@@ -113,10 +279,11 @@ def pop_stash() -> Tuple[bool, str]:
     Returns:
         Tuple of (Success, Message)
     """
-    success, output = run_git_command(["git", "stash", "pop"])
-    if success:
-        return True, "Restored previous changes"
-    return False, f"Stash pop failed: {output}"
+    try:
+        _git(["git", "stash", "pop"])
+    except GitOperationError as e:
+        return False, f"Stash pop failed: {e}"
+    return True, "Restored previous changes"
 
 
 def fetch_change_ref(change_number: str, ref_spec: str) -> Tuple[bool, str]:
@@ -129,10 +296,11 @@ def fetch_change_ref(change_number: str, ref_spec: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (Success, Message)
     """
-    success, output = run_git_command(["git", "fetch", "origin", ref_spec])
-    if success:
-        return True, f"Fetched change {change_number}"
-    return False, f"Fetch failed: {output}"
+    try:
+        _git(["git", "fetch", "origin", ref_spec])
+    except GitOperationError as e:
+        return False, f"Fetch failed: {e}"
+    return True, f"Fetched change {change_number}"
 
 
 def checkout_branch(branch_name: str, create: bool = True) -> Tuple[bool, str]:
@@ -150,10 +318,12 @@ def checkout_branch(branch_name: str, create: bool = True) -> Tuple[bool, str]:
     else:
         command = ["git", "checkout", branch_name]
 
-    success, output = run_git_command(command)
-    if success:
-        return True, f"Switched to branch {branch_name}"
-    return False, f"Failed to checkout branch: {output}"
+    try:
+        _git(command)
+    except GitOperationError as e:
+        return False, f"Failed to checkout branch: {e}"
+    _clear_git_caches()
+    return True, f"Switched to branch {branch_name}"
 
 
 def checkout_fetch_head() -> Tuple[bool, str]:
@@ -162,10 +332,12 @@ def checkout_fetch_head() -> Tuple[bool, str]:
     Returns:
         Tuple of (Success, Message)
     """
-    success, output = run_git_command(["git", "checkout", "FETCH_HEAD"])
-    if success:
-        return True, "Switched to FETCH_HEAD"
-    return False, f"Checkout failed: {output}"
+    try:
+        _git(["git", "checkout", "FETCH_HEAD"])
+    except GitOperationError as e:
+        return False, f"Checkout failed: {e}"
+    _clear_git_caches()
+    return True, "Switched to FETCH_HEAD"
 
 
 def branch_exists(branch_name: str) -> bool:
@@ -177,8 +349,7 @@ def branch_exists(branch_name: str) -> bool:
     Returns:
         True if branch exists
     """
-    success, _ = run_git_command(["git", "rev-parse", "--verify", branch_name])
-    return success
+    return run_git_command_status(["git", "rev-parse", "--verify", branch_name])
 
 
 def delete_branch(branch_name: str, force: bool = False) -> Tuple[bool, str]:
@@ -192,10 +363,12 @@ def delete_branch(branch_name: str, force: bool = False) -> Tuple[bool, str]:
         Tuple of (Success, Message)
     """
     flag = "-D" if force else "-d"
-    success, output = run_git_command(["git", "branch", flag, branch_name])
-    if success:
-        return True, f"Deleted branch {branch_name}"
-    return False, f"Failed to delete branch: {output}"
+    try:
+        _git(["git", "branch", flag, branch_name])
+    except GitOperationError as e:
+        return False, f"Failed to delete branch: {e}"
+    _clear_git_caches()
+    return True, f"Deleted branch {branch_name}"
 
 
 def get_git_remote_url(remote_name: str = "origin") -> Optional[str]:
@@ -207,7 +380,7 @@ def get_git_remote_url(remote_name: str = "origin") -> Optional[str]:
     Returns:
         Remote URL, or None if not found
     """
-    success, output = run_git_command(["git", "remote", "get-url", remote_name])
+    success, output = _git_query(["git", "remote", "get-url", remote_name])
     if success:
         return output.strip()
     return None
@@ -219,7 +392,7 @@ def get_repo_root() -> Optional[str]:
     Returns:
         Absolute path to repo root, or None if not in a repo
     """
-    success, output = run_git_command(["git", "rev-parse", "--show-toplevel"])
+    success, output = _git_query(["git", "rev-parse", "--show-toplevel"])
     if success:
         return output.strip()
     return None
@@ -234,13 +407,14 @@ def check_remote_exists(remote_name: str = "origin") -> bool:
     Returns:
         True if remote exists
     """
-    success, output = run_git_command(["git", "remote"])
+    success, output = _git_query(["git", "remote"])
     if success:
         remotes = output.strip().split("\n")
         return remote_name in remotes
     return False
 
 
+@lru_cache(maxsize=2048)
 def shorten_path(path: str, max_length: int = 60) -> str:
     """Shorten a file path by truncating or compressing.
 
@@ -249,6 +423,9 @@ def shorten_path(path: str, max_length: int = 60) -> str:
     2. Directory Compression: 'f/p/intermediate/filename.kt'
     3. Filename Only: '.../filename.kt'
     4. Filename Truncation: '...name.kt'
+
+    Results are cached, since the same paths are shortened for both the file
+    list and the inline comments of a change.
     """
     if len(path) <= max_length:
         return path
@@ -256,34 +433,41 @@ def shorten_path(path: str, max_length: int = 60) -> str:
     if max_length < 5:
         return f"...{path[-(max_length-3):]}" if max_length > 3 else "..."
 
-    parts = path.split("/")
-    first = parts[0]
-    last = parts[-1]
+    # Work on separator indices and slices of the original string
+    seps = [i for i, c in enumerate(path) if c == "/"]
+    if seps:
+        first = path[: seps[0]]
+        last = path[seps[-1] + 1 :]
+    else:
+        first = last = path
 
     # Tier 1: Middle Truncation "first/.../last" (at least 3 parts)
-    if len(parts) >= 3:
+    if len(seps) >= 2:
         fixed_parts_len = len(first) + 5 + len(last)  # 5 for "/.../"
         if fixed_parts_len <= max_length:
             remaining = max_length - fixed_parts_len
-            middle_parts = []
+            # Keep as many trailing middle parts as fit, as one slice of path
+            start = seps[-1] + 1
             curr_len = 0
-            for p in reversed(parts[1:-1]):
-                if curr_len + len(p) + 1 <= remaining:
-                    middle_parts.insert(0, p)
-                    curr_len += len(p) + 1
+            for i in range(len(seps) - 2, -1, -1):
+                part_len = seps[i + 1] - seps[i]  # part plus its "/"
+                if curr_len + part_len <= remaining:
+                    curr_len += part_len
+                    start = seps[i] + 1
                 else:
                     break
-            if middle_parts:
-                return f"{first}/.../{'/'.join(middle_parts)}/{last}"
-            else:
-                return f"{first}/.../{last}"
+            return f"{first}/.../{path[start:]}"
 
     # Tier 2: Directory Compression "f/p/intermediate/last"
-    if len(parts) >= 2:
-        # Keep last part, compress others to 1 char + /
-        compressed_parts = [p[0] for p in parts[:-1]]
-        compressed_prefix = "/".join(compressed_parts) + "/"
-        if len(compressed_prefix) + len(last) <= max_length:
+    if seps:
+        # Keep last part, compress others to 1 char + / (empty parts stay empty)
+        starts = [0, *(sep + 1 for sep in seps[:-1])]
+        # The prefix length follows from the indices, only build it when it fits
+        prefix_len = len(seps) + sum(a < b for a, b in zip(starts, seps))
+        if prefix_len + len(last) <= max_length:
+            compressed_prefix = "".join(
+                f"{path[a] if a < b else ''}/" for a, b in zip(starts, seps)
+            )
             return f"{compressed_prefix}{last}"
 
     # Tier 3: Filename Only ".../last"
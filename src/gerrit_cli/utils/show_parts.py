@@ -1,6 +1,8 @@
 """Display parts utility for gerrit show command"""
 
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 # Available parts and their abbreviations
 AVAILABLE_PARTS = {
@@ -11,6 +13,13 @@ AVAILABLE_PARTS = {
     "comments": "c",
 }
 
+# Token (full name or abbreviation) -> full name, and the error hint, built once
+_TOKEN_TO_FULL = {
+    **{full: full for full in AVAILABLE_PARTS},
+    **{abbr: full for full, abbr in AVAILABLE_PARTS.items()},
+}
+_AVAILABLE_STR = ", ".join(f"{full}({abbr})" for full, abbr in AVAILABLE_PARTS.items())
+
 # Default parts to display (excluding diff for faster performance)
 DEFAULT_PARTS = ["metadata", "files", "messages", "comments"]
 
@@ -47,33 +56,26 @@ def parse_parts_option(parts_str: str) -> list[str]:
     if parts_str == "all":
         return list(AVAILABLE_PARTS.keys())
 
-    # Parse comma-separated values
-    parts = []
-    abbr_to_full = {abbr: full for full, abbr in AVAILABLE_PARTS.items()}
+    # Parse comma-separated values, resolving full names and abbreviations alike
+    tokens = [t for t in (item.strip() for item in parts_str.split(",")) if t]
+    try:
+        return [_TOKEN_TO_FULL[t] for t in tokens]
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown part: '{e.args[0]}'\nAvailable parts: {_AVAILABLE_STR}"
+        ) from None
 
-    for item in parts_str.split(","):
-        item = item.strip()
 
-        if not item:
-            continue
-
-        # Check if it's a full name
-        if item in AVAILABLE_PARTS:
-            parts.append(item)
-        # Check if it's an abbreviation
-        elif item in abbr_to_full:
-            parts.append(abbr_to_full[item])
-        else:
-            # Unknown part
-            available = []
-            for full, abbr in AVAILABLE_PARTS.items():
-                available.append(f"{full}({abbr})")
-            raise ValueError(
-                f"Unknown part: '{item}'\n"
-                f"Available parts: {', '.join(available)}"
-            )
+@lru_cache(maxsize=32)
+def _parts_map(parts_option: Optional[str]) -> Mapping[str, bool]:
+    """Build the read-only part mapping for a --parts value (cached per value)"""
+    if parts_option:
+        parts_list = parse_parts_option(parts_option)
+    else:
+        parts_list = DEFAULT_PARTS
 
-    return parts
+    # Convert to dictionary (all parts default to False, specified ones set to True)
+    return MappingProxyType({part: (part in parts_list) for part in AVAILABLE_PARTS})
 
 
 def get_parts_to_show(parts_option: Optional[str] = None) -> dict[str, bool]:
@@ -86,10 +88,5 @@ def get_parts_to_show(parts_option: Optional[str] = None) -> dict[str, bool]:
         Mapping from part names to whether they should be displayed
         Example: {"metadata": True, "files": True, "diff": False, ...}
     """
-    if parts_option:
-        parts_list = parse_parts_option(parts_option)
-    else:
-        parts_list = DEFAULT_PARTS
-
-    # Convert to dictionary (all parts default to False, specified ones set to True)
-    return {part: (part in parts_list) for part in AVAILABLE_PARTS.keys()}
+    # Callers may switch parts off afterwards, so hand out a copy of the cached mapping
+    return dict(_parts_map(parts_option or None))
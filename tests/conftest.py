@@ -1,14 +1,33 @@
+import json
+from types import MappingProxyType
+
 import pytest
 from click.testing import CliRunner
 
+from gerrit_cli.client.models import (
+    Account,
+    Change,
+    ChangeDetail,
+    CommentInfo,
+    LabelInfo,
+    MessageInfo,
+)
+from gerrit_cli.formatters.json import JsonFormatter
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     """CliRunner for CLI testing"""
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def json_formatter():
+    """Shared JsonFormatter (stateless, safe to reuse across tests)"""
+    return JsonFormatter()
+
+
+@pytest.fixture(scope="session")
 def gerrit_env():
     """Standard environment variables for tests"""
     return {
@@ -18,21 +37,17 @@ def gerrit_env():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_account():
     """Sample Account model"""
-    from gerrit_cli.client.models import Account
-
     return Account(
         account_id=1000, name="Test User", email="test@example.com", username="testuser"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_change(sample_account):
     """Sample Change model with all fields"""
-    from gerrit_cli.client.models import Change
-
     return Change(
         id="myproject~master~I1234567890",
         project="myproject",
@@ -50,35 +65,52 @@ def sample_change(sample_account):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_change_api_response():
-    """Raw API response dict for a change (with Gerrit field aliases)"""
-    return {
-        "id": "myproject~master~I1234567890",
-        "project": "myproject",
-        "branch": "master",
-        "change_id": "I1234567890",
-        "subject": "Fix bug in parser",
-        "status": "NEW",
-        "created": "2025-01-01 10:00:00.000000000",
-        "updated": "2025-01-10 15:30:00.000000000",
-        "insertions": 50,
-        "deletions": 20,
-        "_number": 12345,
-        "owner": {
-            "_account_id": 1000,
-            "name": "Test User",
-            "email": "test@example.com",
-        },
-        "current_revision": "abcdef1234567890",
-    }
+    """Read-only raw API response for a change (with Gerrit field aliases)
+
+    Spread or copy it (``{**sample_change_api_response, ...}``) to vary fields or to
+    pass it to ``json.dumps``.
+    """
+    return MappingProxyType(
+        {
+            "id": "myproject~master~I1234567890",
+            "project": "myproject",
+            "branch": "master",
+            "change_id": "I1234567890",
+            "subject": "Fix bug in parser",
+            "status": "NEW",
+            "created": "2025-01-01 10:00:00.000000000",
+            "updated": "2025-01-10 15:30:00.000000000",
+            "insertions": 50,
+            "deletions": 20,
+            "_number": 12345,
+            "owner": {
+                "_account_id": 1000,
+                "name": "Test User",
+                "email": "test@example.com",
+            },
+            "current_revision": "abcdef1234567890",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_change_list_body(sample_change_api_response):
+    """Raw list changes response body (XSSI prefix + JSON list with one change)"""
+    return b")]}'\n" + json.dumps([dict(sample_change_api_response)]).encode()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_change_detail_body(sample_change_api_response):
+    """Raw change detail response body without messages or labels"""
+    detail = {**sample_change_api_response, "messages": [], "labels": {}}
+    return b")]}'\n" + json.dumps(detail).encode()
+
+
+@pytest.fixture(scope="session")
 def sample_message_info(sample_account):
     """Sample MessageInfo"""
-    from gerrit_cli.client.models import MessageInfo
-
     return MessageInfo(
         id="msg-001",
         author=sample_account,
@@ -87,22 +119,18 @@ def sample_message_info(sample_account):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_label_info(sample_account):
     """Sample LabelInfo"""
-    from gerrit_cli.client.models import LabelInfo
-
     return LabelInfo(
         value=2,
         approved=sample_account,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_change_detail(sample_change, sample_message_info, sample_label_info):
     """Sample ChangeDetail with messages and labels"""
-    from gerrit_cli.client.models import ChangeDetail
-
     return ChangeDetail(
         **sample_change.model_dump(),
         messages=[sample_message_info],
@@ -110,11 +138,9 @@ def sample_change_detail(sample_change, sample_message_info, sample_label_info):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_comment_info(sample_account):
     """Sample CommentInfo"""
-    from gerrit_cli.client.models import CommentInfo
-
     return CommentInfo(
         id="comment-001",
         patch_set=1,
@@ -126,11 +152,9 @@ def sample_comment_info(sample_account):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_change():
     """Minimal Change with only required fields"""
-    from gerrit_cli.client.models import Change
-
     return Change(
         id="project~branch~I123",
         project="test-project",
@@ -142,3 +166,24 @@ def minimal_change():
         updated="2025-01-01 00:00:00.000000000",
         number=100,
     )
+
+
+@pytest.fixture(scope="session")
+def minimal_change_api_response():
+    """Read-only Gerrit API response with only the required Change fields
+
+    Tests that need variations copy it with ``dict(minimal_change_api_response, **extra)``.
+    """
+    return MappingProxyType(
+        {
+            "id": "test~main~I123",
+            "project": "test",
+            "branch": "main",
+            "change_id": "I123",
+            "subject": "Test",
+            "status": "NEW",
+            "created": "2025-01-01 00:00:00.000000000",
+            "updated": "2025-01-01 00:00:00.000000000",
+            "_number": 999,
+        }
+    )
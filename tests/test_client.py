@@ -11,12 +11,10 @@ class TestGerritClientResponseParsing:
     """Test GerritClient response parsing"""
 
     @respx.mock
-    def test_parse_response_strips_xssi_prefix(self, sample_change_api_response):
+    def test_parse_response_strips_xssi_prefix(self, sample_change_list_body):
         """Test XSSI prefix )]}' is stripped before parsing"""
         respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         with GerritClient("https://gerrit.example.com", "user", "pass") as client:
@@ -48,17 +46,55 @@ class TestGerritClientResponseParsing:
             with GerritClient("https://gerrit.example.com", "user", "pass") as client:
                 client.list_changes()
 
+    @respx.mock
+    def test_parse_response_invalid_json_in_detail_raises_error(self):
+        """Test invalid JSON for a single model also raises ApiError"""
+        respx.get("https://gerrit.example.com/a/changes/12345").mock(
+            return_value=Response(200, text=")]}'\n{not json")
+        )
+
+        with (
+            pytest.raises(ApiError, match="JSON parse failed"),
+            GerritClient("https://gerrit.example.com", "user", "pass") as client,
+        ):
+            client.get_change("12345")
+
+
+class TestGerritClientOrjsonParsing:
+    """Test response parsing through the optional orjson parser"""
+
+    def test_parse_response_uses_orjson(self):
+        """Test orjson parses prefixed bodies, including non-ASCII text"""
+        orjson = pytest.importorskip("orjson")
+        from gerrit_cli.client import api
+
+        assert api._json_loads is orjson.loads
+
+        body = ")]}'\n" + json.dumps({"subject": "修复 🐛", "n": [1, 2]})
+        with GerritClient("https://gerrit.example.com", "user", "pass") as client:
+            data = client._parse_response(Response(200, text=body))
+
+        assert data == {"subject": "修复 🐛", "n": [1, 2]}
+
+    def test_parse_response_orjson_invalid_json_raises_error(self):
+        """Test orjson decode errors are still reported as ApiError"""
+        pytest.importorskip("orjson")
+
+        with (
+            pytest.raises(ApiError, match="JSON parse failed"),
+            GerritClient("https://gerrit.example.com", "user", "pass") as client,
+        ):
+            client._parse_response(Response(200, text=")]}'\n{not json"))
+
 
 class TestGerritClientListChanges:
     """Test list_changes() method"""
 
     @respx.mock
-    def test_list_changes_returns_change_models(self, sample_change_api_response):
+    def test_list_changes_returns_change_models(self, sample_change_list_body):
         """Test list_changes returns list of Change models"""
         respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         with GerritClient("https://gerrit.example.com", "user", "pass") as client:
@@ -83,12 +119,10 @@ class TestGerritClientListChanges:
         assert changes == []
 
     @respx.mock
-    def test_list_changes_with_options(self, sample_change_api_response):
+    def test_list_changes_with_options(self, sample_change_list_body):
         """Test list_changes with options parameter"""
         route = respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         with GerritClient("https://gerrit.example.com", "user", "pass") as client:
@@ -104,16 +138,10 @@ class TestGerritClientGetChangeDetail:
     """Test get_change_detail() method"""
 
     @respx.mock
-    def test_get_change_detail_returns_change_detail_model(self, sample_change_api_response):
+    def test_get_change_detail_returns_change_detail_model(self, sample_change_detail_body):
         """Test get_change_detail returns ChangeDetail model"""
-        change_detail_response = {
-            **sample_change_api_response,
-            "messages": [],
-            "labels": {},
-        }
-
         respx.get("https://gerrit.example.com/a/changes/12345").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(change_detail_response))
+            return_value=Response(200, content=sample_change_detail_body)
         )
 
         with GerritClient("https://gerrit.example.com", "user", "pass") as client:
@@ -124,6 +152,21 @@ class TestGerritClientGetChangeDetail:
         assert hasattr(change, "messages")
         assert hasattr(change, "labels")
 
+    @respx.mock
+    def test_get_change_detail_without_messages(self, sample_change_api_response):
+        """Test include_messages=False does not request the MESSAGES option"""
+        route = respx.get("https://gerrit.example.com/a/changes/12345").mock(
+            return_value=Response(200, text=")]}'\n" + json.dumps(dict(sample_change_api_response)))
+        )
+
+        with GerritClient("https://gerrit.example.com", "user", "pass") as client:
+            change = client.get_change_detail("12345", include_messages=False)
+
+        assert change.messages is None
+        request_url = str(route.calls.last.request.url)
+        assert "o=MESSAGES" not in request_url
+        assert "o=DETAILED_LABELS" in request_url
+
     @respx.mock
     def test_get_change_detail_validates_nested_objects(self, sample_change_api_response):
         """Test nested objects are validated correctly"""
@@ -18,22 +18,20 @@ class TestListCommandJsonOutput:
         result = runner.invoke(cli, ["list", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert data == []
 
     @respx.mock
-    def test_list_command_json_single_change(self, runner, gerrit_env, sample_change_api_response):
+    def test_list_command_json_single_change(self, runner, gerrit_env, sample_change_list_body):
         """Test list command returns single change in JSON array"""
         respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         result = runner.invoke(cli, ["list", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["number"] == 12345
@@ -48,26 +46,24 @@ class TestListCommandJsonOutput:
         respx.get("https://gerrit.example.com/a/changes/").mock(
             return_value=Response(
                 200,
-                text=")]}'\n" + json.dumps([sample_change_api_response, change2, change3]),
+                text=")]}'\n" + json.dumps([dict(sample_change_api_response), change2, change3]),
             )
         )
 
         result = runner.invoke(cli, ["list", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert len(data) == 3
         assert data[0]["number"] == 12345
         assert data[1]["number"] == 12346
         assert data[2]["number"] == 12347
 
     @respx.mock
-    def test_list_command_json_with_query(self, runner, gerrit_env, sample_change_api_response):
+    def test_list_command_json_with_query(self, runner, gerrit_env, sample_change_list_body):
         """Test list command with query parameter"""
         route = respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         result = runner.invoke(
@@ -79,12 +75,10 @@ class TestListCommandJsonOutput:
         assert "status%3Amerged" in str(route.calls.last.request.url)
 
     @respx.mock
-    def test_list_command_json_with_owner(self, runner, gerrit_env, sample_change_api_response):
+    def test_list_command_json_with_owner(self, runner, gerrit_env, sample_change_list_body):
         """Test list command with owner parameter"""
         route = respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         result = runner.invoke(
@@ -96,12 +90,10 @@ class TestListCommandJsonOutput:
         assert "owner%3Atest_user" in str(route.calls.last.request.url)
 
     @respx.mock
-    def test_list_command_json_strips_xssi_prefix(self, runner, gerrit_env, sample_change_api_response):
+    def test_list_command_json_strips_xssi_prefix(self, runner, gerrit_env, sample_change_list_body):
         """Test XSSI prefix is properly stripped"""
         respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(
-                200, text=")]}'\n" + json.dumps([sample_change_api_response])
-            )
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         result = runner.invoke(cli, ["list", "--format", "json"], env=gerrit_env)
@@ -109,76 +101,60 @@ class TestListCommandJsonOutput:
         assert result.exit_code == 0
         assert not result.output.startswith(")]}'\n")
 
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert isinstance(data, list)
 
 
 class TestViewCommandJsonOutput:
     """Test 'gerrit show --format json' command"""
 
+    _CHANGE_URL = "https://gerrit.example.com/a/changes/12345"
+    _EMPTY = b")]}'\n{}"
+
+    @classmethod
+    def _mock_view(cls, detail_body, files=False, comments=None):
+        """Mock the endpoints 'show' reads, returning the change detail route"""
+        route = respx.get(cls._CHANGE_URL).mock(return_value=Response(200, content=detail_body))
+        if files:
+            respx.get(f"{cls._CHANGE_URL}/revisions/current/files/").mock(
+                return_value=Response(200, content=cls._EMPTY)
+            )
+        if comments is not None:
+            respx.get(f"{cls._CHANGE_URL}/comments").mock(
+                return_value=Response(200, content=comments)
+            )
+        return route
+
     @respx.mock
-    def test_view_command_json_basic(self, runner, gerrit_env, sample_change_api_response):
+    def test_view_command_json_basic(self, runner, gerrit_env, sample_change_detail_body):
         """Test view command basic JSON output"""
-        change_detail = {
-            **sample_change_api_response,
-            "messages": [],
-            "labels": {},
-        }
-
-        respx.get("https://gerrit.example.com/a/changes/12345").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(change_detail))
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/revisions/current/files/").mock(
-            return_value=Response(200, text=")]}'\n{}")
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/comments").mock(
-            return_value=Response(200, text=")]}'\n{}")
-        )
+        self._mock_view(sample_change_detail_body, files=True, comments=self._EMPTY)
 
         result = runner.invoke(cli, ["show", "12345", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert "change" in data
         assert data["change"]["number"] == 12345
 
     @respx.mock
-    def test_view_command_json_structure(self, runner, gerrit_env, sample_change_api_response):
+    def test_view_command_json_structure(self, runner, gerrit_env, sample_change_detail_body):
         """Test view command JSON structure contains expected keys"""
-        change_detail = {
-            **sample_change_api_response,
-            "messages": [],
-            "labels": {},
-        }
-
-        respx.get("https://gerrit.example.com/a/changes/12345").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(change_detail))
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/revisions/current/files/").mock(
-            return_value=Response(200, text=")]}'\n{}")
-        )
+        self._mock_view(sample_change_detail_body, files=True)
 
         result = runner.invoke(
             cli, ["show", "12345", "--format", "json", "--parts", "m,f"], env=gerrit_env
         )
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
 
         assert "change" in data
 
     @respx.mock
-    def test_view_command_json_only_metadata(self, runner, gerrit_env, sample_change_api_response):
+    def test_view_command_json_only_metadata(self, runner, gerrit_env, sample_change_detail_body):
         """Test view command with only metadata part"""
-        change_detail = {
-            **sample_change_api_response,
-            "messages": [],
-            "labels": {},
-        }
-
-        route_detail = respx.get("https://gerrit.example.com/a/changes/12345").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(change_detail))
-        )
+        route_detail = self._mock_view(sample_change_detail_body)
 
         result = runner.invoke(
             cli, ["show", "12345", "--format", "json", "--parts", "m"], env=gerrit_env
@@ -187,7 +163,7 @@ class TestViewCommandJsonOutput:
         assert result.exit_code == 0
         assert route_detail.called
 
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert "change" in data
 
     @respx.mock
@@ -211,34 +187,21 @@ class TestViewCommandJsonOutput:
             },
         }
 
-        respx.get("https://gerrit.example.com/a/changes/12345").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(change_detail))
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/revisions/current/files/").mock(
-            return_value=Response(200, text=")]}'\n{}")
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/comments").mock(
-            return_value=Response(200, text=")]}'\n{}")
-        )
+        detail_body = b")]}'\n" + json.dumps(change_detail).encode()
+        self._mock_view(detail_body, files=True, comments=self._EMPTY)
 
         result = runner.invoke(cli, ["show", "12345", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
 
         assert data["change"]["messages"][0]["author"]["account_id"] == 1000
         assert data["change"]["labels"]["Code-Review"]["approved"]["account_id"] == 1000
         assert data["change"]["owner"]["account_id"] == 1000
 
     @respx.mock
-    def test_view_command_json_with_comments(self, runner, gerrit_env, sample_change_api_response):
+    def test_view_command_json_with_comments(self, runner, gerrit_env, sample_change_detail_body):
         """Test view command JSON output with comments"""
-        change_detail = {
-            **sample_change_api_response,
-            "messages": [],
-            "labels": {},
-        }
-
         comments_response = {
             "src/main.py": [
                 {
@@ -253,20 +216,13 @@ class TestViewCommandJsonOutput:
             ]
         }
 
-        respx.get("https://gerrit.example.com/a/changes/12345").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(change_detail))
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/revisions/current/files/").mock(
-            return_value=Response(200, text=")]}'\n{}")
-        )
-        respx.get("https://gerrit.example.com/a/changes/12345/comments").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps(comments_response))
-        )
+        comments_body = b")]}'\n" + json.dumps(comments_response).encode()
+        self._mock_view(sample_change_detail_body, files=True, comments=comments_body)
 
         result = runner.invoke(cli, ["show", "12345", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
 
         # Verify comments are properly serialized
         assert "comments" in data
@@ -289,15 +245,15 @@ class TestViewCommandJsonOutput:
         result = runner.invoke(cli, ["list", "--format", "json"], env=gerrit_env)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert len(data) == 1
         assert data[0]["more_changes"] is True
 
     @respx.mock
-    def test_list_command_json_with_limit(self, runner, gerrit_env, sample_change_api_response):
+    def test_list_command_json_with_limit(self, runner, gerrit_env, sample_change_list_body):
         """Test list command with custom limit parameter"""
         route = respx.get("https://gerrit.example.com/a/changes/").mock(
-            return_value=Response(200, text=")]}'\n" + json.dumps([sample_change_api_response]))
+            return_value=Response(200, content=sample_change_list_body)
         )
 
         result = runner.invoke(
@@ -308,5 +264,5 @@ class TestViewCommandJsonOutput:
         assert route.called
         assert "n=50" in str(route.calls.last.request.url)
 
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert len(data) == 1
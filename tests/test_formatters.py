@@ -1,6 +1,8 @@
 import json
 import pytest
+from rich.console import Console
 from gerrit_cli.formatters.json import JsonFormatter
+from gerrit_cli.formatters.table import PLAIN_TABLE_THRESHOLD, TableFormatter
 from gerrit_cli.formatters import get_formatter
 from gerrit_cli.client.models import Change, ChangeDetail, Account, MessageInfo, LabelInfo
 
@@ -8,19 +10,17 @@ from gerrit_cli.client.models import Change, ChangeDetail, Account, MessageInfo,
 class TestJsonFormatterBasicFunctionality:
     """Test basic functionality of JsonFormatter"""
 
-    def test_json_format_empty_changes_list(self):
+    def test_json_format_empty_changes_list(self, json_formatter):
         """Test formatting empty changes list returns empty JSON array"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([])
+        result = json_formatter.format_changes([])
 
         assert isinstance(result, str)
         data = json.loads(result)
         assert data == []
 
-    def test_json_format_single_change(self, sample_change):
+    def test_json_format_single_change(self, json_formatter, sample_change):
         """Test formatting single Change object with all fields"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([sample_change])
+        result = json_formatter.format_changes([sample_change])
 
         assert isinstance(result, str)
         data = json.loads(result)
@@ -40,7 +40,7 @@ class TestJsonFormatterBasicFunctionality:
         assert item["owner"]["account_id"] == 1000
         assert item["owner"]["name"] == "Test User"
 
-    def test_json_format_multiple_changes(self, sample_change, sample_account):
+    def test_json_format_multiple_changes(self, json_formatter, sample_change, sample_account):
         """Test formatting multiple Change objects preserves order"""
         change2 = Change(
             id="project2~main~I999",
@@ -55,8 +55,7 @@ class TestJsonFormatterBasicFunctionality:
             owner=sample_account,
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_changes([sample_change, change2])
+        result = json_formatter.format_changes([sample_change, change2])
 
         data = json.loads(result)
         assert len(data) == 2
@@ -64,10 +63,9 @@ class TestJsonFormatterBasicFunctionality:
         assert data[1]["number"] == 12346
         assert data[1]["status"] == "MERGED"
 
-    def test_json_format_change_detail_basic(self, sample_change_detail):
+    def test_json_format_change_detail_basic(self, json_formatter, sample_change_detail):
         """Test formatting ChangeDetail object with extended fields"""
-        formatter = JsonFormatter()
-        result = formatter.format_change_detail(sample_change_detail)
+        result = json_formatter.format_change_detail(sample_change_detail)
 
         data = json.loads(result)
 
@@ -81,10 +79,9 @@ class TestJsonFormatterBasicFunctionality:
 class TestJsonFormatterNestedObjects:
     """Test nested object serialization"""
 
-    def test_json_format_change_with_owner(self, sample_change):
+    def test_json_format_change_with_owner(self, json_formatter, sample_change):
         """Test nested Account object serialization"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([sample_change])
+        result = json_formatter.format_changes([sample_change])
 
         data = json.loads(result)
         owner = data[0]["owner"]
@@ -95,10 +92,9 @@ class TestJsonFormatterNestedObjects:
         assert owner["email"] == "test@example.com"
         assert owner["username"] == "testuser"
 
-    def test_json_format_change_detail_with_messages(self, sample_change_detail):
+    def test_json_format_change_detail_with_messages(self, json_formatter, sample_change_detail):
         """Test messages array serialization"""
-        formatter = JsonFormatter()
-        result = formatter.format_change_detail(sample_change_detail)
+        result = json_formatter.format_change_detail(sample_change_detail)
 
         data = json.loads(result)
         messages = data["messages"]
@@ -108,10 +104,9 @@ class TestJsonFormatterNestedObjects:
         assert messages[0]["message"] == "Patch Set 1: Code-Review+2\n\nLGTM!"
         assert messages[0]["author"]["account_id"] == 1000
 
-    def test_json_format_change_detail_with_labels(self, sample_change_detail):
+    def test_json_format_change_detail_with_labels(self, json_formatter, sample_change_detail):
         """Test labels dict serialization"""
-        formatter = JsonFormatter()
-        result = formatter.format_change_detail(sample_change_detail)
+        result = json_formatter.format_change_detail(sample_change_detail)
 
         data = json.loads(result)
         labels = data["labels"]
@@ -120,10 +115,9 @@ class TestJsonFormatterNestedObjects:
         assert labels["Code-Review"]["value"] == 2
         assert labels["Code-Review"]["approved"]["account_id"] == 1000
 
-    def test_json_format_nested_structure_integrity(self, sample_change_detail):
+    def test_json_format_nested_structure_integrity(self, json_formatter, sample_change_detail):
         """Test multi-level nested objects maintain integrity"""
-        formatter = JsonFormatter()
-        result = formatter.format_change_detail(sample_change_detail)
+        result = json_formatter.format_change_detail(sample_change_detail)
 
         data = json.loads(result)
 
@@ -135,18 +129,16 @@ class TestJsonFormatterNestedObjects:
 class TestJsonFormatterEdgeCases:
     """Test edge cases and boundary conditions"""
 
-    def test_json_format_change_with_none_owner(self, minimal_change):
+    def test_json_format_change_with_none_owner(self, json_formatter, minimal_change):
         """Test Change with owner=None outputs null"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([minimal_change])
+        result = json_formatter.format_changes([minimal_change])
 
         data = json.loads(result)
         assert data[0]["owner"] is None
 
-    def test_json_format_minimal_change(self, minimal_change):
+    def test_json_format_minimal_change(self, json_formatter, minimal_change):
         """Test Change with only required fields"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([minimal_change])
+        result = json_formatter.format_changes([minimal_change])
 
         data = json.loads(result)
         item = data[0]
@@ -157,14 +149,13 @@ class TestJsonFormatterEdgeCases:
         assert item["deletions"] == 0
         assert item["owner"] is None
 
-    def test_json_format_empty_labels(self, sample_change):
+    def test_json_format_empty_labels(self, json_formatter, sample_change):
         """Test ChangeDetail with empty labels dict"""
         change_detail = ChangeDetail(
             **sample_change.model_dump(), messages=[], labels={}
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_change_detail(change_detail)
+        result = json_formatter.format_change_detail(change_detail)
 
         data = json.loads(result)
         assert data["labels"] == {}
@@ -173,7 +164,7 @@ class TestJsonFormatterEdgeCases:
 class TestJsonFormatterCharacterEncoding:
     """Test character encoding and special characters"""
 
-    def test_json_format_utf8_characters(self, sample_account):
+    def test_json_format_utf8_characters(self, json_formatter, sample_account):
         """Test UTF-8 characters (Chinese, emoji) are preserved"""
         change = Change(
             id="test~main~I456",
@@ -188,8 +179,7 @@ class TestJsonFormatterCharacterEncoding:
             owner=sample_account,
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_changes([change])
+        result = json_formatter.format_changes([change])
 
         assert "修复Bug 🐛" in result
         assert "\\u" not in result
@@ -197,7 +187,7 @@ class TestJsonFormatterCharacterEncoding:
         data = json.loads(result)
         assert data[0]["subject"] == "修复Bug 🐛 in system"
 
-    def test_json_format_special_characters(self, sample_account):
+    def test_json_format_special_characters(self, json_formatter, sample_account):
         """Test JSON special characters are properly escaped"""
         change = Change(
             id="test~main~I789",
@@ -212,8 +202,7 @@ class TestJsonFormatterCharacterEncoding:
             owner=sample_account,
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_changes([change])
+        result = json_formatter.format_changes([change])
 
         data = json.loads(result)
         assert data[0]["subject"] == 'Test "quotes" and\nnewlines\ttabs'
@@ -223,19 +212,24 @@ class TestJsonFormatterFormat:
     """Test JSON output format"""
 
     def test_json_indentation_format(self, sample_change):
-        """Test indent=2 produces proper formatting"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([sample_change])
+        """Test pretty=True produces indented output"""
+        result = JsonFormatter(pretty=True).format_changes([sample_change])
 
         lines = result.split("\n")
         assert len(lines) > 1
 
         assert any("  " in line for line in lines)
 
-    def test_json_output_is_valid(self, sample_change):
+    def test_json_compact_when_not_pretty(self, sample_change):
+        """Test pretty=False produces single-line JSON"""
+        result = JsonFormatter(pretty=False).format_changes([sample_change])
+
+        assert "\n" not in result
+        assert json.loads(result)[0]["number"] == 12345
+
+    def test_json_output_is_valid(self, json_formatter, sample_change):
         """Test output is always valid parseable JSON"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([sample_change])
+        result = json_formatter.format_changes([sample_change])
 
         try:
             data = json.loads(result)
@@ -243,6 +237,35 @@ class TestJsonFormatterFormat:
         except json.JSONDecodeError:
             pytest.fail("Output is not valid JSON")
 
+    @pytest.mark.parametrize("isatty", [True, False])
+    def test_json_pretty_defaults_to_terminal_detection(self, monkeypatch, sample_change, isatty):
+        """Test the default indents exactly when stdout is a terminal"""
+        monkeypatch.setattr("sys.stdout.isatty", lambda: isatty)
+
+        result = JsonFormatter().format_changes([sample_change])
+
+        assert ("\n" in result) is isatty
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_orjson_output_matches_fallback(
+        self, monkeypatch, sample_change_detail, sample_comment_info, pretty
+    ):
+        """Test the orjson path emits the same bytes as the pydantic-core fallback"""
+        pytest.importorskip("orjson")
+        from gerrit_cli.formatters import json as json_formatter_module
+
+        data = {
+            "change": sample_change_detail,
+            "files": {"src/修复.py": {"lines_inserted": 3}},
+            "comments": {"src/main.py": [sample_comment_info]},
+        }
+
+        fast = json_formatter_module.to_json(data, pretty=pretty)
+        monkeypatch.setattr(json_formatter_module, "_HAS_ORJSON", False)
+        fallback = json_formatter_module.to_json(data, pretty=pretty)
+
+        assert fast == fallback
+
 
 class TestFormatterFactory:
     """Test formatter factory function"""
@@ -252,6 +275,10 @@ class TestFormatterFactory:
         formatter = get_formatter("json")
         assert isinstance(formatter, JsonFormatter)
 
+    def test_get_formatter_factory_table_shares_console(self):
+        """Test get_formatter('table') instances reuse one Console"""
+        assert get_formatter("table").console is get_formatter("table").console
+
     def test_get_formatter_factory_invalid(self):
         """Test get_formatter with invalid type raises ValueError"""
         with pytest.raises(ValueError, match="Unsupported format type"):
@@ -261,19 +288,17 @@ class TestFormatterFactory:
 class TestFormatterParameters:
     """Test formatter parameter handling"""
 
-    def test_json_format_has_more_flag_ignored(self, sample_change):
+    def test_json_format_has_more_flag_ignored(self, json_formatter, sample_change):
         """Test has_more parameter doesn't affect JSON output"""
-        formatter = JsonFormatter()
-        result1 = formatter.format_changes([sample_change], has_more=False)
-        result2 = formatter.format_changes([sample_change], has_more=True)
+        result1 = json_formatter.format_changes([sample_change], has_more=False)
+        result2 = json_formatter.format_changes([sample_change], has_more=True)
 
         assert result1 == result2
 
-    def test_json_format_show_comments_flag_ignored(self, sample_change_detail):
+    def test_json_format_show_comments_flag_ignored(self, json_formatter, sample_change_detail):
         """Test show_comments parameter doesn't affect JSON output"""
-        formatter = JsonFormatter()
-        result1 = formatter.format_change_detail(sample_change_detail, show_comments=False)
-        result2 = formatter.format_change_detail(sample_change_detail, show_comments=True)
+        result1 = json_formatter.format_change_detail(sample_change_detail, show_comments=False)
+        result2 = json_formatter.format_change_detail(sample_change_detail, show_comments=True)
 
         assert result1 == result2
 
@@ -281,36 +306,33 @@ class TestFormatterParameters:
 class TestJsonFormatterAdvancedScenarios:
     """Test advanced scenarios and edge cases"""
 
-    def test_json_format_different_statuses(self, sample_account):
+    @pytest.mark.parametrize(
+        "status,number",
+        [("NEW", 1000), ("MERGED", 1001), ("ABANDONED", 1002), ("SUBMITTED", 1003)],
+    )
+    def test_json_format_different_statuses(self, json_formatter, status, number):
         """Test formatting changes with different statuses"""
-        statuses = ["NEW", "MERGED", "ABANDONED", "SUBMITTED"]
-        changes = []
-
-        for i, status in enumerate(statuses):
-            change = Change(
-                id=f"project~main~I{i}",
-                project="test",
-                branch="main",
-                change_id=f"I{i}",
-                subject=f"Change {i}",
-                status=status,
-                created="2025-01-01 00:00:00.000000000",
-                updated="2025-01-01 00:00:00.000000000",
-                number=1000 + i,
-            )
-            changes.append(change)
-
-        formatter = JsonFormatter()
-        result = formatter.format_changes(changes)
+        change = Change.model_construct(
+            id=f"project~main~I{number}",
+            project="test",
+            branch="main",
+            change_id=f"I{number}",
+            subject=f"Change {number}",
+            status=status,
+            created="2025-01-01 00:00:00.000000000",
+            updated="2025-01-01 00:00:00.000000000",
+            number=number,
+        )
 
-        data = json.loads(result)
-        assert len(data) == 4
-        for i, item in enumerate(data):
-            assert item["status"] == statuses[i]
+        data = json.loads(json_formatter.format_changes([change]))
+
+        assert len(data) == 1
+        assert data[0]["status"] == status
+        assert data[0]["number"] == number
 
-    def test_json_format_large_numbers(self, sample_account):
+    def test_json_format_large_numbers(self, json_formatter, sample_account):
         """Test formatting changes with very large insertions/deletions"""
-        change = Change(
+        change = Change.model_construct(
             id="test~main~I999",
             project="test",
             branch="main",
@@ -325,18 +347,16 @@ class TestJsonFormatterAdvancedScenarios:
             owner=sample_account,
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_changes([change])
+        result = json_formatter.format_changes([change])
 
         data = json.loads(result)
         assert data[0]["number"] == 99999
         assert data[0]["insertions"] == 999999
         assert data[0]["deletions"] == 888888
 
-    def test_json_format_timestamp_format(self, sample_change):
+    def test_json_format_timestamp_format(self, json_formatter, sample_change):
         """Test timestamp fields are preserved correctly in Gerrit format"""
-        formatter = JsonFormatter()
-        result = formatter.format_changes([sample_change])
+        result = json_formatter.format_changes([sample_change])
 
         data = json.loads(result)
         # Gerrit timestamps: "YYYY-MM-DD HH:MM:SS.000000000"
@@ -345,9 +365,9 @@ class TestJsonFormatterAdvancedScenarios:
         assert "." in data[0]["created"]
         assert len(data[0]["created"].split(".")[-1]) == 9  # 9 decimal places
 
-    def test_json_format_none_current_revision(self, sample_account):
+    def test_json_format_none_current_revision(self, json_formatter, sample_account):
         """Test Change with None current_revision"""
-        change = Change(
+        change = Change.model_construct(
             id="test~main~I123",
             project="test",
             branch="main",
@@ -361,15 +381,14 @@ class TestJsonFormatterAdvancedScenarios:
             current_revision=None,
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_changes([change])
+        result = json_formatter.format_changes([change])
 
         data = json.loads(result)
         assert data[0]["current_revision"] is None
 
-    def test_json_format_zero_insertions_deletions(self, sample_account):
+    def test_json_format_zero_insertions_deletions(self, json_formatter, sample_account):
         """Test Change with zero insertions and deletions"""
-        change = Change(
+        change = Change.model_construct(
             id="test~main~I456",
             project="test",
             branch="main",
@@ -384,9 +403,154 @@ class TestJsonFormatterAdvancedScenarios:
             owner=sample_account,
         )
 
-        formatter = JsonFormatter()
-        result = formatter.format_changes([change])
+        result = json_formatter.format_changes([change])
 
         data = json.loads(result)
         assert data[0]["insertions"] == 0
         assert data[0]["deletions"] == 0
+
+
+class TestTableFormatterTime:
+    """Test TableFormatter relative time formatting"""
+
+    def test_format_time_parses_gerrit_timestamp(self):
+        """Test Gerrit timestamps with nanoseconds are parsed"""
+        formatter = TableFormatter()
+        assert formatter._format_time("2000-01-01 00:00:00.000000000").endswith("years ago")
+
+    def test_format_time_without_nanoseconds(self):
+        """Test timestamps without fractional part are parsed"""
+        formatter = TableFormatter()
+        assert formatter._format_time("2000-01-01 00:00:00").endswith("years ago")
+
+    def test_format_time_invalid_returns_input(self):
+        """Test unparseable values are returned unchanged"""
+        formatter = TableFormatter()
+        assert formatter._format_time("not a time") == "not a time"
+        assert formatter._format_time("2025-13-01 10:00:00") == "2025-13-01 10:00:00"
+
+
+class TestTableFormatterRendering:
+    """Test TableFormatter section rendering"""
+
+    def test_metadata_title_keeps_brackets_in_subject(self, sample_change_detail):
+        """Test subjects containing [..] are not interpreted as Rich markup"""
+        formatter = TableFormatter()
+        formatter.console = Console(force_terminal=False, width=120)
+        change = sample_change_detail.model_copy(update={"subject": "[WIP] Fix [red]bug[/red]"})
+        result = formatter.format_change_complete(change, show_parts={"metadata": True})
+
+        assert "Change 12345: [WIP] Fix [red]bug[/red]  [NEW]" in result
+
+    def test_no_parts_returns_empty_string(self, sample_change_detail):
+        """Test nothing is rendered when every part is disabled or empty"""
+        formatter = TableFormatter()
+        show_parts = {"metadata": False, "files": True, "comments": True, "diff": True}
+        result = formatter.format_change_complete(
+            sample_change_detail, files={}, diffs={}, comments={}, show_parts=show_parts
+        )
+
+        assert result == ""
+
+    def test_comments_with_only_empty_lists(self, sample_change_detail):
+        """Test comment data without any comments renders as no comments"""
+        formatter = TableFormatter()
+        formatter.console = Console(force_terminal=False, width=120)
+        result = formatter.format_change_complete(
+            sample_change_detail, comments={"src/a.py": []}, show_parts={"comments": True}
+        )
+
+        assert "INLINE COMMENTS" in result
+        assert "No inline comments" in result
+
+
+class TestTableFormatterPlainOutput:
+    """Test TableFormatter plain-text fast path for large non-terminal output"""
+
+    @staticmethod
+    def _changes(sample_change, count):
+        return [sample_change.model_copy(update={"number": i}) for i in range(count)]
+
+    def test_large_list_non_terminal_uses_plain_table(self, sample_change):
+        """Test plain aligned table is emitted above the row threshold"""
+        formatter = TableFormatter()
+        formatter.console = Console(force_terminal=False, width=120)
+        count = PLAIN_TABLE_THRESHOLD + 1
+        result = formatter.format_changes(self._changes(sample_change, count), has_more=True)
+
+        lines = result.splitlines()
+        assert lines[0] == f"Changes ({count} items) (more available)"
+        assert lines[1].split() == ["ID", "Subject", "Owner", "Project", "Status", "+/-", "Updated"]
+        assert len(lines) == count + 2
+        assert "Fix bug in parser" in lines[2]
+        assert "│" not in result
+
+    def test_small_list_non_terminal_uses_rich_table(self, sample_change):
+        """Test small lists still render through Rich"""
+        formatter = TableFormatter()
+        formatter.console = Console(force_terminal=False, width=120)
+        result = formatter.format_changes(self._changes(sample_change, 3))
+
+        assert "│" in result
+
+
+# Gerrit diff shared by the unified diff tests: context, change, context, addition, skip
+GERRIT_DIFF = {
+    "content": [
+        {"ab": ["c1", "c2", "c3"]},
+        {"a": ["old"], "b": ["new"]},
+        {"ab": ["c4", "c5", "c6"]},
+        {"b": ["added"]},
+        {"skip": 40},
+    ]
+}
+
+
+class TestTableFormatterUnifiedDiff:
+    """Test Gerrit diff to unified diff conversion"""
+
+    def test_zero_context_shows_only_changed_lines(self):
+        """Test context=0 replaces every context block with a skip marker"""
+        result = TableFormatter()._convert_gerrit_diff_to_unified(GERRIT_DIFF, context=0)
+
+        assert result.split("\n") == [
+            "@@ ... skipped 3 lines ... @@",
+            "-old",
+            "+new",
+            "@@ ... skipped 3 lines ... @@",
+            "+added",
+            "@@ ... skipped 40 lines ... @@",
+        ]
+
+    def test_none_context_shows_all_lines(self):
+        """Test context=None keeps every context line"""
+        result = TableFormatter()._convert_gerrit_diff_to_unified(GERRIT_DIFF, context=None)
+
+        assert result.split("\n") == [
+            " c1",
+            " c2",
+            " c3",
+            "-old",
+            "+new",
+            " c4",
+            " c5",
+            " c6",
+            "+added",
+            "@@ ... skipped 40 lines ... @@",
+        ]
+
+    def test_limited_context_trims_context_blocks(self):
+        """Test context=1 keeps one line on each side of a change"""
+        result = TableFormatter()._convert_gerrit_diff_to_unified(GERRIT_DIFF, context=1)
+
+        assert result.split("\n") == [
+            "@@ ... skipped 2 lines ... @@",
+            " c3",
+            "-old",
+            "+new",
+            " c4",
+            "@@ ... skipped 1 lines ... @@",
+            " c6",
+            "+added",
+            "@@ ... skipped 40 lines ... @@",
+        ]
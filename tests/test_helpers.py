@@ -0,0 +1,187 @@
+import subprocess
+
+import pytest
+
+from gerrit_cli.utils import helpers
+from gerrit_cli.utils.helpers import (
+    check_working_directory_clean,
+    gather_repo_state,
+    shorten_path,
+)
+
+
+def _git(*args, cwd, check=True):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=check,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def outside_repo(tmp_path, monkeypatch):
+    """Empty directory that git will not resolve to any enclosing repository"""
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def git_repo(outside_repo):
+    """Repository on branch 'main' with one commit, used as the working directory"""
+    _git("init", "-q", "-b", "main", cwd=outside_repo)
+    _git("commit", "-q", "--allow-empty", "-m", "initial", cwd=outside_repo)
+    return outside_repo
+
+
+class TestGatherRepoState:
+    """Test gather_repo_state() against scratch repositories"""
+
+    def test_repo_with_remote(self, git_repo):
+        """Test all probes are reported for a repository with the remote"""
+        _git("remote", "add", "origin", "https://gerrit.example.com/project", cwd=git_repo)
+
+        state = gather_repo_state("origin")
+
+        assert state["is_repo"] is True
+        assert state["root"] == str(git_repo.resolve())
+        assert state["branch"] == "main"
+        assert state["remote_url"] == "https://gerrit.example.com/project"
+
+    def test_detached_head_has_no_branch(self, git_repo):
+        """Test 'HEAD' from rev-parse on a detached HEAD is reported as None"""
+        _git("checkout", "-q", "--detach", cwd=git_repo)
+
+        state = gather_repo_state("origin")
+
+        assert state["is_repo"] is True
+        assert state["branch"] is None
+
+    def test_missing_remote(self, git_repo):
+        """Test a missing remote gives remote_url None"""
+        state = gather_repo_state("origin")
+
+        assert state["is_repo"] is True
+        assert state["remote_url"] is None
+
+    def test_not_a_repo(self, outside_repo):
+        """Test every probe is unavailable outside a repository"""
+        state = gather_repo_state("origin")
+
+        assert state == {"is_repo": False, "root": None, "branch": None, "remote_url": None}
+
+    def test_git_not_startable(self, git_repo, monkeypatch):
+        """Test probes already started are reaped when a later one fails to launch"""
+        started = []
+        real_popen = subprocess.Popen
+
+        def flaky_popen(command, **kwargs):
+            if len(started) == 2:
+                raise OSError("git not found")
+            process = real_popen(command, **kwargs)
+            started.append(process)
+            return process
+
+        monkeypatch.setattr(helpers.subprocess, "Popen", flaky_popen)
+
+        state = gather_repo_state("origin")
+
+        assert state == {"is_repo": False, "root": None, "branch": None, "remote_url": None}
+        assert all(process.returncode is not None for process in started)
+
+
+@pytest.fixture
+def committed_repo(git_repo):
+    """git_repo with a tracked 'a.txt' and 'b.txt'"""
+    (git_repo / "a.txt").write_text("a\n")
+    (git_repo / "b.txt").write_text("b\n")
+    _git("add", "a.txt", "b.txt", cwd=git_repo)
+    _git("commit", "-q", "-m", "add files", cwd=git_repo)
+    return git_repo
+
+
+class TestCheckWorkingDirectoryClean:
+    """Test check_working_directory_clean() against scratch repositories"""
+
+    def test_clean_tree(self, committed_repo):
+        """Test a tree without changes is reported clean"""
+        assert check_working_directory_clean() == (True, "Working directory clean")
+
+    def test_unstaged_only(self, committed_repo):
+        """Test a work tree modification (' M' in short format) is not counted as staged"""
+        (committed_repo / "a.txt").write_text("changed\n")
+
+        assert check_working_directory_clean() == (False, "1 unstaged changes")
+
+    def test_staged_and_unstaged_same_file(self, committed_repo):
+        """Test a file changed in both the index and the work tree counts once for each"""
+        (committed_repo / "a.txt").write_text("staged\n")
+        _git("add", "a.txt", cwd=committed_repo)
+        (committed_repo / "a.txt").write_text("unstaged\n")
+
+        assert check_working_directory_clean() == (False, "1 staged changes, 1 unstaged changes")
+
+    def test_rename_skips_original_path(self, committed_repo):
+        """Test the original path record of a rename is not parsed as an entry"""
+        # Parsed as a record of its own, the original path would count as untracked
+        (committed_repo / "? old.txt").write_text("old\n")
+        _git("add", "? old.txt", cwd=committed_repo)
+        _git("commit", "-q", "-m", "add old", cwd=committed_repo)
+        _git("mv", "? old.txt", "renamed file.txt", cwd=committed_repo)
+
+        assert check_working_directory_clean() == (False, "1 staged changes")
+
+    def test_untracked(self, committed_repo):
+        """Test untracked files are counted separately"""
+        (committed_repo / "new.txt").write_text("new\n")
+
+        assert check_working_directory_clean() == (False, "1 untracked files")
+
+    def test_merge_conflict_counts_as_unstaged(self, committed_repo):
+        """Test an unmerged path is counted as an unstaged change"""
+        _git("checkout", "-q", "-b", "other", cwd=committed_repo)
+        (committed_repo / "a.txt").write_text("other\n")
+        _git("commit", "-q", "-am", "other", cwd=committed_repo)
+        _git("checkout", "-q", "main", cwd=committed_repo)
+        (committed_repo / "a.txt").write_text("main\n")
+        _git("commit", "-q", "-am", "main", cwd=committed_repo)
+        _git("merge", "-q", "other", cwd=committed_repo, check=False)
+
+        assert check_working_directory_clean() == (False, "1 unstaged changes")
+
+    def test_not_a_repo(self, outside_repo):
+        """Test a failing git status is reported as not clean"""
+        assert check_working_directory_clean() == (False, "Failed to check Git status")
+
+
+class TestShortenPath:
+    """Test shorten_path() tiers and edge cases"""
+
+    @pytest.mark.parametrize(
+        "path,max_length,expected",
+        [
+            # Tier 1: middle truncation keeps as many trailing directories as fit
+            ("first/second/third/fourth/file.py", 25, "first/.../fourth/file.py"),
+            # Tier 2: directory compression
+            ("verylongfirstdir/b/c/file.py", 15, "v/b/c/file.py"),
+            # Tier 3: file name only
+            ("alpha/beta/gamma/delta/long_file_name.py", 21, ".../long_file_name.py"),
+            # Tier 4: plain truncation of the file name
+            ("directory/a_very_long_file_name_that_is_long.py", 20, "...e_that_is_long.py"),
+            # Leading "/" gives an empty first segment
+            ("/usr/local/lib/python/site/file.py", 20, "/.../site/file.py"),
+            ("/dir/file.py", 10, "/d/file.py"),
+            # Empty segments stay empty when compressed
+            ("abc//bcd/c.py", 11, "a//b/c.py"),
+            ("", 10, ""),
+            ("file.py", 60, "file.py"),
+            ("a_really_long_file_name.py", 10, "...name.py"),
+        ],
+    )
+    def test_shorten_path(self, path, max_length, expected):
+        """Test each path is shortened to the expected form within max_length"""
+        result = shorten_path(path, max_length)
+
+        assert result == expected
+        assert len(result) <= max_length
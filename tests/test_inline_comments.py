@@ -1,65 +1,42 @@
 import pytest
 import respx
 from httpx import Response
-from click.testing import CliRunner
 from gerrit_cli.cli import main as cli
 from gerrit_cli.client.models import ReviewInput
+from gerrit_cli.commands.review import _parse_inline_comments
 
-@pytest.fixture
-def runner():
-    return CliRunner()
+# Review endpoint response, serialized once for every test
+_REVIEW_RESPONSE_BODY = b'{"labels": {"Code-Review": 2}}'
 
-@respx.mock
-def test_review_inline_comment(runner):
-    # Mock API
-    route = respx.post("https://gerrit.example.com/a/changes/12345/revisions/current/review").mock(
-        return_value=Response(200, json={"labels": {"Code-Review": 2}})
-    )
+@pytest.fixture
+def review_route():
+    """Mock the review endpoint for change 12345"""
+    with respx.mock:
+        yield respx.post("https://gerrit.example.com/a/changes/12345/revisions/current/review").mock(
+            return_value=Response(
+                200, content=_REVIEW_RESPONSE_BODY, headers={"Content-Type": "application/json"}
+            )
+        )
 
-    result = runner.invoke(
-        cli,
+def test_review_inline_comment():
+    comments = _parse_inline_comments(
         [
-            "review",
-            "12345",
-            "--inline-comment",
-            "src/main.py#10",
-            "Fix typo",
-            "--inline-comment",
-            "src/utils.py#20",
-            "Refactor this",
-            "--inline-comment",
-            "src/range.py#10-20",
-            "Multi-line comment",
-            "--inline-comment",
-            "src/utils.py#L12C13-L12C19",
-            "Char range",
-        ],
-        env={
-            "GERRIT_URL": "https://gerrit.example.com",
-            "GERRIT_USERNAME": "user",
-            "GERRIT_PASSWORD": "password",
-        },
+            ("src/main.py#10", "Fix typo"),
+            ("src/utils.py#20", "Refactor this"),
+            ("src/range.py#10-20", "Multi-line comment"),
+            ("src/utils.py#L12C13-L12C19", "Char range"),
+        ]
     )
 
-    assert result.exit_code == 0
-    assert "Review sent to Change 12345" in result.output
+    assert set(comments) == {"src/main.py", "src/utils.py", "src/range.py"}
 
-    # Verify request payload
-    assert route.called
-    request_data = ReviewInput.model_validate_json(route.calls.last.request.content)
-    
-    assert request_data.comments is not None
-    assert "src/main.py" in request_data.comments
-    assert "src/utils.py" in request_data.comments
-    assert "src/range.py" in request_data.comments
-    
-    assert request_data.comments["src/main.py"][0].line == 10
-    assert request_data.comments["src/main.py"][0].message == "Fix typo"
-    
-    assert request_data.comments["src/utils.py"][0].line == 20
-    assert request_data.comments["src/utils.py"][0].message == "Refactor this"
+    assert comments["src/main.py"][0].line == 10
+    assert comments["src/main.py"][0].message == "Fix typo"
 
-    range_comment = request_data.comments["src/range.py"][0]
+    assert comments["src/utils.py"][0].line == 20
+    assert comments["src/utils.py"][0].message == "Refactor this"
+
+    range_comment = comments["src/range.py"][0]
     assert range_comment.line == 20
     assert range_comment.message == "Multi-line comment"
     assert range_comment.range is not None
@@ -68,7 +45,7 @@ def test_review_inline_comment(runner):
     assert range_comment.range.end_line == 20
     assert range_comment.range.end_character == 10000
 
-    char_comment = request_data.comments["src/utils.py"][1]
+    char_comment = comments["src/utils.py"][1]
     assert char_comment.line == 12
     assert char_comment.message == "Char range"
     assert char_comment.range is not None
@@ -77,12 +54,13 @@ def test_review_inline_comment(runner):
     assert char_comment.range.end_line == 12
     assert char_comment.range.end_character == 19
 
-@respx.mock
-def test_review_mixed_inline_and_labels(runner):
-    # Mock API
-    route = respx.post("https://gerrit.example.com/a/changes/12345/revisions/current/review").mock(
-        return_value=Response(200, json={"labels": {"Code-Review": 2}})
-    )
+@pytest.mark.parametrize("spec", ["src/main.py", "src/main.py#abc", "src/main.py#1-x"])
+def test_review_inline_comment_invalid_location(spec):
+    with pytest.raises(ValueError):
+        _parse_inline_comments([(spec, "msg")])
+
+def test_review_mixed_inline_and_labels(runner, review_route):
+    route = review_route
 
     result = runner.invoke(
         cli,
@@ -1,4 +1,7 @@
+import json
+
 import pytest
+from pydantic import ValidationError
 from gerrit_cli.client.models import (
     Account,
     Change,
@@ -6,11 +9,85 @@ from gerrit_cli.client.models import (
     CommentInfo,
     ReviewInput,
     CommentInput,
-    MessageInfo,
     LabelInfo,
 )
 
 
+def _extend_change(change, **extra):
+    """Build a ChangeDetail from an already validated Change plus extra fields
+
+    The Change's fields are reused as-is instead of dumped and re-validated. The extra
+    fields still go through validation since they are what the tests check, which is
+    why this is not model_construct.
+    """
+    return ChangeDetail(**dict(change), **extra)
+
+
+# Nested ChangeDetail payloads in raw API form (Gerrit field aliases)
+_REVIEWERS = {
+    "REVIEWER": [
+        {"_account_id": 1001, "name": "Reviewer 1"},
+        {"_account_id": 1002, "name": "Reviewer 2"},
+    ],
+    "CC": [
+        {"_account_id": 1003, "name": "Observer 1"},
+    ],
+}
+
+_LABELS = {
+    "Code-Review": {
+        "value": 2,
+        "approved": {"_account_id": 1000, "name": "Test User"},
+    },
+    "Verified": {"value": 1},
+    "API-Review": {"value": 0},
+}
+
+_MESSAGES = [
+    {
+        "id": "msg-1",
+        "author": {"_account_id": 1001, "name": "Author 1"},
+        "date": "2025-01-01 10:00:00.000000000",
+        "message": "Uploaded patch set 1.",
+    },
+    {
+        "id": "msg-2",
+        "author": {"_account_id": 1002, "name": "Reviewer 1"},
+        "date": "2025-01-02 11:00:00.000000000",
+        "message": "Patch Set 1: Code-Review+2\n\nLGTM!",
+    },
+    {
+        "id": "msg-3",
+        "author": {"_account_id": 1003, "name": "Bot"},
+        "date": "2025-01-02 11:05:00.000000000",
+        "message": "Change has been successfully merged.",
+        "tag": "autogenerated:gerrit:merged",
+    },
+]
+
+
+def _assert_reviewers(reviewers):
+    assert len(reviewers["REVIEWER"]) == 2
+    assert len(reviewers["CC"]) == 1
+    assert reviewers["REVIEWER"][0]["account_id"] == 1001
+    assert reviewers["CC"][0]["account_id"] == 1003
+
+
+def _assert_labels(labels):
+    assert set(labels) == {"Code-Review", "Verified", "API-Review"}
+    assert labels["Code-Review"]["value"] == 2
+    assert labels["Code-Review"]["approved"]["account_id"] == 1000
+    assert labels["Verified"]["value"] == 1
+    assert labels["API-Review"]["value"] == 0
+
+
+def _assert_messages(messages):
+    assert len(messages) == 3
+    assert messages[0]["id"] == "msg-1"
+    assert messages[1]["message"].startswith("Patch Set 1:")
+    assert messages[2]["tag"] == "autogenerated:gerrit:merged"
+
+
 class TestChangeModel:
     """Test Change model serialization and field aliases"""
 
@@ -26,56 +103,14 @@ class TestChangeModel:
         assert data["insertions"] == 50
         assert data["deletions"] == 20
 
-    def test_change_field_alias_number(self, sample_change_api_response):
-        """Test _number alias maps to number field"""
-        change = Change.model_validate(sample_change_api_response)
-
-        assert change.number == 12345
-
-        dumped = change.model_dump(mode="json")
-        assert dumped["number"] == 12345
-        assert "_number" not in dumped
-
-    def test_change_field_alias_more_changes(self):
-        """Test _more_changes alias maps to more_changes field"""
-        api_response = {
-            "id": "test~main~I123",
-            "project": "test",
-            "branch": "main",
-            "change_id": "I123",
-            "subject": "Test",
-            "status": "NEW",
-            "created": "2025-01-01 00:00:00.000000000",
-            "updated": "2025-01-01 00:00:00.000000000",
-            "_number": 999,
-            "_more_changes": True,
-        }
-
-        change = Change.model_validate(api_response)
-        assert change.more_changes is True
-
-        dumped = change.model_dump(mode="json")
-        assert dumped["more_changes"] is True
-        assert "_more_changes" not in dumped
-
-    def test_change_optional_owner_none(self):
+    def test_change_optional_owner_none(self, minimal_change_api_response):
         """Test owner=None serializes as null"""
-        api_response = {
-            "id": "test~main~I123",
-            "project": "test",
-            "branch": "main",
-            "change_id": "I123",
-            "subject": "Test",
-            "status": "NEW",
-            "created": "2025-01-01 00:00:00.000000000",
-            "updated": "2025-01-01 00:00:00.000000000",
-            "_number": 999,
-        }
+        api_response = dict(minimal_change_api_response)
 
         change = Change.model_validate(api_response)
         assert change.owner is None
 
-        dumped = change.model_dump(mode="json")
+        dumped = change.model_dump()
         assert dumped["owner"] is None
 
     def test_change_display_id_property(self, sample_change):
@@ -87,21 +122,6 @@ class TestChangeModel:
 class TestAccountModel:
     """Test Account model serialization and field aliases"""
 
-    def test_account_field_alias_account_id(self):
-        """Test _account_id alias maps to account_id field"""
-        api_response = {
-            "_account_id": 1000,
-            "name": "Test User",
-            "email": "test@example.com",
-        }
-
-        account = Account.model_validate(api_response)
-        assert account.account_id == 1000
-
-        dumped = account.model_dump(mode="json")
-        assert dumped["account_id"] == 1000
-        assert "_account_id" not in dumped
-
     def test_account_optional_fields(self):
         """Test email/username optional fields"""
         api_response = {"_account_id": 1000, "name": "User"}
@@ -110,13 +130,13 @@ class TestAccountModel:
         assert account.email is None
         assert account.username is None
 
-        dumped = account.model_dump(mode="json")
+        dumped = account.model_dump()
         assert dumped["email"] is None
         assert dumped["username"] is None
 
-    def test_account_model_validate(self, sample_account):
+    def test_account_model_validate(self):
         """Test Account validates from dict correctly"""
-        data = sample_account.model_dump()
+        data = {"account_id": 1000, "name": "Test User", "email": "test@example.com"}
         account2 = Account.model_validate(data)
 
         assert account2.account_id == 1000
@@ -129,25 +149,21 @@ class TestChangeDetailModel:
 
     def test_change_detail_inherits_change(self, sample_change_detail):
         """Test ChangeDetail has all Change fields"""
-        data = sample_change_detail.model_dump(mode="json")
-
-        assert data["number"] == 12345
-        assert data["project"] == "myproject"
-        assert data["subject"] == "Fix bug in parser"
-        assert data["owner"]["account_id"] == 1000
+        assert sample_change_detail.number == 12345
+        assert sample_change_detail.project == "myproject"
+        assert sample_change_detail.subject == "Fix bug in parser"
+        assert sample_change_detail.owner.account_id == 1000
 
     def test_change_detail_extended_fields(self, sample_change_detail):
         """Test ChangeDetail has messages, labels, reviewers fields"""
-        data = sample_change_detail.model_dump(mode="json")
-
-        assert "messages" in data
-        assert "labels" in data
-        assert isinstance(data["messages"], list)
-        assert isinstance(data["labels"], dict)
+        assert isinstance(sample_change_detail.messages, list)
+        assert isinstance(sample_change_detail.labels, dict)
+        assert sample_change_detail.messages[0].id == "msg-001"
 
     def test_change_detail_nested_serialization(self, sample_change_detail):
         """Test nested MessageInfo/LabelInfo serialize correctly"""
-        data = sample_change_detail.model_dump(mode="json")
+        # Same pydantic-core JSON serializer the CLI's JSON output goes through
+        data = json.loads(sample_change_detail.model_dump_json())
 
         assert len(data["messages"]) == 1
         assert data["messages"][0]["id"] == "msg-001"
@@ -157,6 +173,13 @@ class TestChangeDetailModel:
         assert data["labels"]["Code-Review"]["value"] == 2
         assert data["labels"]["Code-Review"]["approved"]["account_id"] == 1000
 
+    def test_change_detail_is_frozen(self, sample_change_detail):
+        """Test response models reject mutation so shared instances stay intact"""
+        with pytest.raises(ValidationError):
+            sample_change_detail.subject = "changed"
+        with pytest.raises(ValidationError):
+            sample_change_detail.owner.name = "changed"
+
 
 class TestCommentInfoModel:
     """Test CommentInfo model"""
@@ -173,21 +196,20 @@ class TestCommentInfoModel:
 
     def test_comment_info_optional_fields(self):
         """Test CommentInfo with minimal fields"""
-        comment = CommentInfo(message="Simple comment")
+        # Literal, already-typed input: skip validation, defaults are still filled in
+        comment = CommentInfo.model_construct(message="Simple comment")
 
-        data = comment.model_dump(mode="json")
+        data = comment.model_dump()
         assert data["message"] == "Simple comment"
         assert data["line"] is None
         assert data["author"] is None
 
     def test_comment_info_nested_range(self):
         """Test CommentInfo with range object"""
-        from gerrit_cli.client.models import CommentRange
-
-        comment_range = CommentRange(
-            start_line=10, start_character=5, end_line=10, end_character=15
+        comment = CommentInfo(
+            message="Range comment",
+            range={"start_line": 10, "start_character": 5, "end_line": 10, "end_character": 15},
         )
-        comment = CommentInfo(message="Range comment", range=comment_range.model_dump())
 
         data = comment.model_dump(mode="json")
         assert data["range"]["start_line"] == 10
@@ -199,9 +221,9 @@ class TestReviewInputModel:
 
     def test_review_input_exclude_none(self):
         """Test exclude_none=True excludes null fields"""
-        review = ReviewInput(message="LGTM")
+        review = ReviewInput.model_construct(message="LGTM")
 
-        data = review.model_dump(exclude_none=True, mode="json")
+        data = review.model_dump(exclude_none=True)
         assert "message" in data
         assert "labels" not in data
         assert "comments" not in data
@@ -211,7 +233,7 @@ class TestReviewInputModel:
         comment = CommentInput(path="src/main.py", line=10, message="Fix this")
         review = ReviewInput(comments={"src/main.py": [comment]})
 
-        data = review.model_dump(mode="json")
+        data = review.model_dump()
         assert "src/main.py" in data["comments"]
         assert data["comments"]["src/main.py"][0]["line"] == 10
         assert data["comments"]["src/main.py"][0]["message"] == "Fix this"
@@ -220,7 +242,7 @@ class TestReviewInputModel:
         """Test ReviewInput with labels"""
         review = ReviewInput(labels={"Code-Review": 2, "Verified": 1})
 
-        data = review.model_dump(exclude_none=True, mode="json")
+        data = review.model_dump()
         assert data["labels"]["Code-Review"] == 2
         assert data["labels"]["Verified"] == 1
 
@@ -228,21 +250,32 @@ class TestReviewInputModel:
 class TestFieldAliasMapping:
     """Test comprehensive field alias mapping"""
 
-    def test_all_gerrit_aliases_mapped_correctly(self):
+    @pytest.mark.parametrize(
+        "model,alias,field,value",
+        [
+            (Change, "_number", "number", 12345),
+            (Change, "_more_changes", "more_changes", True),
+            (Account, "_account_id", "account_id", 1000),
+        ],
+    )
+    def test_alias_roundtrip(self, minimal_change_api_response, model, alias, field, value):
+        """Test a Gerrit _field alias loads into its field and dumps under the field name"""
+        base = minimal_change_api_response if model is Change else {"name": "User"}
+        obj = model.model_validate({**base, alias: value})
+        assert getattr(obj, field) == value
+
+        dumped = obj.model_dump(mode="json")
+        assert dumped[field] == value
+        assert alias not in dumped
+
+    def test_all_gerrit_aliases_mapped_correctly(self, minimal_change_api_response):
         """Test all Gerrit _field aliases map to standard names"""
-        api_response = {
-            "id": "test~main~I123",
-            "project": "test",
-            "branch": "main",
-            "change_id": "I123",
-            "subject": "Test",
-            "status": "NEW",
-            "created": "2025-01-01 00:00:00.000000000",
-            "updated": "2025-01-01 00:00:00.000000000",
-            "_number": 12345,
-            "_more_changes": False,
-            "owner": {"_account_id": 1000, "name": "User"},
-        }
+        api_response = dict(
+            minimal_change_api_response,
+            _number=12345,
+            _more_changes=False,
+            owner={"_account_id": 1000, "name": "User"},
+        )
 
         change = Change.model_validate(api_response)
         dumped = change.model_dump(mode="json")
@@ -255,14 +288,15 @@ class TestFieldAliasMapping:
         assert "_more_changes" not in dumped
         assert "_account_id" not in dumped["owner"]
 
-    def test_model_round_trip_preserves_data(self, sample_change_api_response):
+    def test_model_round_trip_preserves_data(self, sample_change):
         """Test model -> JSON -> model preserves all data"""
-        change1 = Change.model_validate(sample_change_api_response)
+        change1 = sample_change
 
-        dumped = change1.model_dump(mode="json")
+        raw = change1.model_dump_json()
 
-        change2 = Change.model_validate(dumped)
+        change2 = Change.model_validate_json(raw)
 
+        assert change2 == change1
         assert change1.number == change2.number
         assert change1.subject == change2.subject
         assert change1.owner.account_id == change2.owner.account_id
@@ -271,91 +305,23 @@ class TestFieldAliasMapping:
 class TestComplexNestedStructures:
     """Test complex nested data structures"""
 
-    def test_change_detail_with_multiple_reviewers(self, sample_change):
-        """Test ChangeDetail with multiple reviewers of different types"""
-        reviewers = {
-            "REVIEWER": [
-                {"_account_id": 1001, "name": "Reviewer 1"},
-                {"_account_id": 1002, "name": "Reviewer 2"},
-            ],
-            "CC": [
-                {"_account_id": 1003, "name": "Observer 1"},
-            ],
-        }
-
-        change_detail = ChangeDetail(
-            **sample_change.model_dump(),
-            reviewers=reviewers,
-        )
-
-        data = change_detail.model_dump(mode="json")
-
-        assert "reviewers" in data
-        assert "REVIEWER" in data["reviewers"]
-        assert "CC" in data["reviewers"]
-        assert len(data["reviewers"]["REVIEWER"]) == 2
-        assert len(data["reviewers"]["CC"]) == 1
-        assert data["reviewers"]["REVIEWER"][0]["account_id"] == 1001
-        assert data["reviewers"]["CC"][0]["account_id"] == 1003
-
-    def test_change_detail_with_multiple_labels(self, sample_change, sample_account):
-        """Test ChangeDetail with multiple label types"""
-        labels = {
-            "Code-Review": {
-                "value": 2,
-                "approved": sample_account.model_dump(),
-            },
-            "Verified": {"value": 1},
-            "API-Review": {"value": 0},
-        }
+    @pytest.mark.parametrize(
+        "field,value,check",
+        [
+            ("reviewers", _REVIEWERS, _assert_reviewers),
+            ("labels", _LABELS, _assert_labels),
+            ("messages", _MESSAGES, _assert_messages),
+        ],
+        ids=["reviewers", "labels", "messages"],
+    )
+    def test_change_detail_with_multiple_entries(self, sample_change, field, value, check):
+        """Test ChangeDetail with several reviewers, labels or messages"""
+        change_detail = _extend_change(sample_change, **{field: value})
 
-        change_detail = ChangeDetail(**sample_change.model_dump(), labels=labels)
+        data = json.loads(change_detail.model_dump_json())
 
-        data = change_detail.model_dump(mode="json")
-
-        assert "labels" in data
-        assert "Code-Review" in data["labels"]
-        assert "Verified" in data["labels"]
-        assert "API-Review" in data["labels"]
-        assert data["labels"]["Code-Review"]["value"] == 2
-        assert data["labels"]["Verified"]["value"] == 1
-        assert data["labels"]["API-Review"]["value"] == 0
-
-    def test_change_detail_with_multiple_messages(self, sample_change):
-        """Test ChangeDetail with multiple messages"""
-        messages = [
-            {
-                "id": "msg-1",
-                "author": {"_account_id": 1001, "name": "Author 1"},
-                "date": "2025-01-01 10:00:00.000000000",
-                "message": "Uploaded patch set 1.",
-            },
-            {
-                "id": "msg-2",
-                "author": {"_account_id": 1002, "name": "Reviewer 1"},
-                "date": "2025-01-02 11:00:00.000000000",
-                "message": "Patch Set 1: Code-Review+2\n\nLGTM!",
-            },
-            {
-                "id": "msg-3",
-                "author": {"_account_id": 1003, "name": "Bot"},
-                "date": "2025-01-02 11:05:00.000000000",
-                "message": "Change has been successfully merged.",
-                "tag": "autogenerated:gerrit:merged",
-            },
-        ]
-
-        change_detail = ChangeDetail(
-            **sample_change.model_dump(),
-            messages=[MessageInfo.model_validate(msg) for msg in messages],
-        )
-
-        data = change_detail.model_dump(mode="json")
-
-        assert len(data["messages"]) == 3
-        assert data["messages"][0]["id"] == "msg-1"
-        assert data["messages"][1]["message"].startswith("Patch Set 1:")
-        assert data["messages"][2]["tag"] == "autogenerated:gerrit:merged"
+        assert field in data
+        check(data[field])
 
     def test_permitted_labels_structure(self, sample_change):
         """Test permitted_labels field structure"""
@@ -364,12 +330,9 @@ class TestComplexNestedStructures:
             "Verified": ["-1", " 0", "+1"],
         }
 
-        change_detail = ChangeDetail(
-            **sample_change.model_dump(),
-            permitted_labels=permitted_labels,
-        )
+        change_detail = _extend_change(sample_change, permitted_labels=permitted_labels)
 
-        data = change_detail.model_dump(mode="json")
+        data = json.loads(change_detail.model_dump_json())
 
         assert "permitted_labels" in data
         assert "Code-Review" in data["permitted_labels"]